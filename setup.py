@@ -12,6 +12,8 @@ setup(
         "openpyxl",
         "python-dotenv",
         "requests",
+        "requests-cache",
+        "orjson",
         "openai",
         "beautifulsoup4",
         "pyyaml"
@@ -1,6 +1,7 @@
 # src/excel/formatters.py
 
-from openpyxl.styles import PatternFill, Font, Border, Side, Alignment
+from openpyxl.styles import PatternFill, Font, Border, Side, Alignment, NamedStyle
+from openpyxl.styles.borders import DEFAULT_BORDER
 
 # Example color fills
 LABEL_FILL = PatternFill(start_color="00FFFF", end_color="00FFFF", fill_type="solid")  # Light blue
@@ -16,38 +17,79 @@ DATA_ARIAL_FONT = Font(name="Arial", size=10)
 DATA_ARIAL_BOLD_FONT = Font(name="Arial", size=10, bold=True)
 DATA_ARIAL_ITALIC_FONT = Font(name="Arial", size=10, italic=True)
 
+# Named styles (name -> font) registered on every workbook by register_styles.
+# Assigning cell.style by name lets openpyxl share one style record across
+# all cells instead of deduplicating per-cell fonts when saving.
+NAMED_STYLE_FONTS = {
+    "title": TITLE_FONT,
+    "label": LABEL_FONT,
+    "data_tnr": DATA_TNR_FONT,
+    "data_tnr_italic": DATA_TNR_ITALIC_FONT,
+    "data_tnr_bold": DATA_TNR_BOLD_FONT,
+    "data_arial": DATA_ARIAL_FONT,
+    "data_arial_bold": DATA_ARIAL_BOLD_FONT,
+    "data_arial_italic": DATA_ARIAL_ITALIC_FONT,
+}
+
+# Alignment for long text kept in a single wrapped (usually merged) cell
+WRAP_TOP_ALIGNMENT = Alignment(wrap_text=True, vertical='top')
+
 # Borders
 THIN_BORDER_SIDE = Side(style='thin', color='000000')
 THIN_BORDER = Border(
     left=THIN_BORDER_SIDE, right=THIN_BORDER_SIDE, top=THIN_BORDER_SIDE, bottom=THIN_BORDER_SIDE
 )
+
 THICK_BORDER_SIDE = Side(style='thick', color='000000')
 THICK_BORDER = Border(
     left=THICK_BORDER_SIDE, right=THICK_BORDER_SIDE, top=THICK_BORDER_SIDE, bottom=THICK_BORDER_SIDE
 )
 
+def register_styles(wb):
+    """Registers the named styles on wb, skipping any it already has (e.g. reopened files)."""
+    existing = set(wb.named_styles)
+    for name, font in NAMED_STYLE_FONTS.items():
+        if name not in existing:
+            wb.add_named_style(NamedStyle(name=name, font=font))
+
 def title_fill_range(ws, row_number, left_col, right_col):
     for cc in range(left_col, right_col + 1):
         cell = ws.cell(row_number, cc)
         if cell.fill.patternType is None:
             cell.fill = LABEL_FILL
 
+def _row_border(existing_border, is_left, is_right):
+    """The border apply_table_border gives a cell that currently has existing_border."""
+    return Border(
+        top=THIN_BORDER_SIDE,
+        bottom=THIN_BORDER_SIDE,
+        left=existing_border.left or THIN_BORDER_SIDE if is_left else existing_border.left,
+        right=existing_border.right or THIN_BORDER_SIDE if is_right else existing_border.right,
+        diagonal=existing_border.diagonal,
+        diagonal_direction=existing_border.diagonal_direction,
+        outline=existing_border.outline,
+        vertical=existing_border.vertical,
+        horizontal=existing_border.horizontal,
+    )
+
+# Borders for cells without any style (whose border is openpyxl's default), built
+# once by the same rule and indexed by is_left * 2 + is_right. Styles are
+# immutable once assigned, so every such cell can share one instance.
+_UNSTYLED_ROW_BORDERS = tuple(
+    _row_border(DEFAULT_BORDER, is_left, is_right)
+    for is_left in (False, True)
+    for is_right in (False, True)
+)
+
 def apply_table_border(ws, row, start_col, end_col):
     """
     Applies a thin border around a group of cells in one row, from start_col to end_col.
     """
     for col in range(start_col, end_col + 1):
         cell = ws.cell(row=row, column=col)
-        existing_border = cell.border
-        new_border = Border(
-            top=THIN_BORDER_SIDE,
-            bottom=THIN_BORDER_SIDE,
-            left=existing_border.left or THIN_BORDER_SIDE if col == start_col else existing_border.left,
-            right=existing_border.right or THIN_BORDER_SIDE if col == end_col else existing_border.right,
-            diagonal=existing_border.diagonal,
-            diagonal_direction=existing_border.diagonal_direction,
-            outline=existing_border.outline,
-            vertical=existing_border.vertical,
-            horizontal=existing_border.horizontal,
-        )
-        cell.border = new_border
+        is_left = col == start_col
+        is_right = col == end_col
+        if cell.has_style:
+            cell.border = _row_border(cell.border, is_left, is_right)
+        else:
+            cell.border = _UNSTYLED_ROW_BORDERS[is_left * 2 + is_right]
@@ -2,26 +2,21 @@
 
 import os
 import sys
-import json
-import pandas as pd
-from openpyxl import load_workbook
+import math
+import orjson
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.utils import get_column_letter
 from datetime import datetime
-import textwrap
 import re
 
 from .formatters import (
     LABEL_FILL,
     DATA_FILL,
-    TITLE_FONT,
-    LABEL_FONT,
-    DATA_TNR_FONT,
-    DATA_TNR_ITALIC_FONT,
-    DATA_TNR_BOLD_FONT,
-    DATA_ARIAL_FONT,
-    DATA_ARIAL_ITALIC_FONT,
     THIN_BORDER,
     THICK_BORDER,
+    WRAP_TOP_ALIGNMENT,
+    register_styles,
     title_fill_range,
     apply_table_border
 )
@@ -29,16 +24,66 @@ from .formatters import (
 def create_or_append_xls(xls_filename):
     file_exists = os.path.exists(xls_filename)
     if file_exists:
-        # Append mode with overlay if sheet exists
-        writer = pd.ExcelWriter(xls_filename, engine='openpyxl', mode='a', if_sheet_exists='overlay')
+        # Reopen the existing workbook; sheets that already exist are overlaid
+        wb = load_workbook(xls_filename)
     else:
-        writer = pd.ExcelWriter(xls_filename, engine='openpyxl', mode='w')
-    return writer, file_exists
+        # Fresh workbooks are streamed row by row; write_only has no default sheet
+        wb = Workbook(write_only=True)
+    register_styles(wb)
+    return wb, file_exists
 
-def format_workbook(writer):
+class WorkbookCache:
+    """
+    Keeps workbooks open by filename across generate_excel_for_ticker_year
+    calls, so writing the same file again in one process skips the
+    save/load_workbook round trip in between. flush() saves them all.
+
+    Files are named per ticker and year, so this only helps a caller that
+    rewrites the same ticker/year more than once; different tickers never
+    share a workbook. Staged workbooks live only in memory until flushed,
+    and the cache isn't safe to use from several threads.
+    """
+
+    def __init__(self):
+        self._books = {}
+
+    def get(self, xls_filename):
+        """Returns (wb, file_exists) for xls_filename, opening it on first use."""
+        wb = self._books.pop(xls_filename, None)
+        if wb is not None and wb.write_only:
+            # Streamed sheets can't be revisited: save, then reopen for overlay
+            wb.save(xls_filename)
+            wb = None
+
+        if wb is None:
+            wb, file_exists = create_or_append_xls(xls_filename)
+        else:
+            file_exists = True
+        self._books[xls_filename] = wb
+        return wb, file_exists
+
+    def save(self, xls_filename):
+        """Saves and forgets the cached workbook for xls_filename."""
+        wb = self._books.pop(xls_filename, None)
+        if wb is not None:
+            wb.save(xls_filename)
+
+    def flush(self):
+        """Saves and forgets every cached workbook."""
+        for xls_filename in list(self._books):
+            self.save(xls_filename)
+            print(f"Workbook saved to {xls_filename}.")
+
+_workbook_cache = WorkbookCache()
+
+def flush_workbooks():
+    """Saves every workbook left open by generate_excel_for_ticker_year(..., defer_save=True)."""
+    _workbook_cache.flush()
+
+def format_workbook(wb):
     """Remove gridlines from all worksheets."""
-    for sheetname in writer.book.sheetnames:
-        ws = writer.book[sheetname]
+    for sheetname in wb.sheetnames:
+        ws = wb[sheetname]
         ws.sheet_view.showGridLines = False
 
 def load_final_output(ticker):
@@ -46,14 +91,19 @@ def load_final_output(ticker):
     if not os.path.exists(file_path):
         print(f"Error: {file_path} does not exist.")
         sys.exit(1)
-    with open(file_path, "r") as f:
-        data = json.load(f)
+    with open(file_path, "rb") as f:
+        data = orjson.loads(f.read())
     return data
 
-def generate_excel_for_ticker_year(ticker: str, year: int):
+def generate_excel_for_ticker_year(ticker: str, year: int, defer_save: bool = False):
     """
     Reproduce the old main usage:
     Generate the Excel file for the given ticker/year => ./output/{ticker}.{YY}.2.xlsx
+
+    With defer_save=True the workbook stays open in memory for later calls
+    to the same file and is only written out by flush_workbooks(); anything
+    not flushed is lost. It only pays off when one process writes the same
+    ticker/year file more than once.
     """
     ticker = ticker.upper()
     year_2_digits = str(year)[-2:]
@@ -62,28 +112,32 @@ def generate_excel_for_ticker_year(ticker: str, year: int):
     # 1) Load JSON data
     final_output = load_final_output(ticker)
 
-    # 2) Create or append XLS
-    writer, file_exists = create_or_append_xls(xls_filename)
+    # 2) Create or append XLS (reusing a workbook still open from an earlier call)
+    wb, file_exists = _workbook_cache.get(xls_filename)
 
     # 3) Write data
-    _write_all_sheets(writer, final_output)
+    _write_all_sheets(wb, final_output)
 
     # 4) Formatting
-    format_workbook(writer)
+    format_workbook(wb)
 
     # 5) Save
-    writer.close()
+    if defer_save:
+        print(f"Data for {ticker} staged for {xls_filename}.")
+        return
+    _workbook_cache.save(xls_filename)
     print(f"Data for {ticker} written to {xls_filename} successfully.")
 
-def _write_all_sheets(writer, final_output):
-    """Write each sheet from final_output just like old code did."""
-    _write_summary_sheet(writer, final_output)
-    _write_company_description(writer, final_output)
-    _write_analyses_sheet(writer, final_output)
-    _write_profit_desc_sheet(writer, final_output)
-    _write_balance_sheet_sheet(writer, final_output)
-    _write_studies_sheet(writer, final_output)
-    _write_qualities_sheet(writer, final_output)
+def _write_all_sheets(wb, final_output):
+    """
+    Write each sheet from final_output just like old code did.
+
+    Sheets are written one after another on purpose: write_only workbooks
+    stream sheets in creation order, and openpyxl builds cells in pure Python
+    under the GIL, so worker threads would not overlap any real work.
+    """
+    for write_sheet in _SHEET_WRITERS:
+        write_sheet(wb, final_output)
 
 #
 # The next set of private _write_* methods are basically your old
@@ -93,12 +147,21 @@ def _write_all_sheets(writer, final_output):
 # For brevity, we show a couple of them:
 #
 
-def _write_summary_sheet(writer, final_output):
-    wb = writer.book
-    if 'Summary' not in wb.sheetnames:
-        wb.create_sheet('Summary')
-    ws = wb['Summary']
+# Column letters precomputed once; index with _COLS[col - 1] in write loops
+# instead of calling get_column_letter per cell
+_COLS = tuple(get_column_letter(i) for i in range(1, 101))
+
+# Approximate characters per row of the merged B:H description box
+# (default column widths, Times New Roman 10)
+_DESCRIPTION_CHARS_PER_ROW = 70
+_DESCRIPTION_LAST_COL = 8  # column H
+
+def _write_only_cell(ws, value, style):
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
 
+def _write_summary_sheet(wb, final_output):
     summary_data = final_output["summary"]
     company_name = summary_data["company_name"]
     exchange = summary_data["exchange"]
@@ -107,40 +170,83 @@ def _write_summary_sheet(writer, final_output):
 
     # Example usage
     combined_title = f"{company_name.upper()} ({exchange}) - {symbol}"
+
+    # The description is a single wrapped cell merged across B:H, with enough
+    # rows to hold the text, rather than one cell per pre-wrapped line
+    start_row = 5
+    col = 2  # column B
+    description_rows = max(1, math.ceil(len(description) / _DESCRIPTION_CHARS_PER_ROW))
+    description_range = (
+        f"{_COLS[col - 1]}{start_row}:"
+        f"{_COLS[_DESCRIPTION_LAST_COL - 1]}{start_row + description_rows - 1}"
+    )
+
+    if wb.write_only:
+        # Write-only sheets can't be addressed by coordinate: emit whole rows
+        # top to bottom, padding the leading columns with None.
+        ws = wb.create_sheet('Summary')
+        ws.append([None] * 4 + [_write_only_cell(ws, combined_title, "title")])  # E1
+        ws.append([])
+        ws.append([])
+        ws.append([_write_only_cell(ws, "Company Description", "label")])  # A4
+        description_cell = _write_only_cell(ws, description, "data_tnr")
+        description_cell.alignment = WRAP_TOP_ALIGNMENT
+        ws.append([None] * (col - 1) + [description_cell])  # B5
+        ws.merged_cells.add(description_range)
+        return
+
+    # Appending to an existing workbook: overlay cells in place
+    if 'Summary' not in wb.sheetnames:
+        wb.create_sheet('Summary')
+    ws = wb['Summary']
+
     ws['E1'] = combined_title
-    ws['E1'].font = TITLE_FONT
+    ws['E1'].style = "title"
 
     ws['A4'] = "Company Description"
-    ws['A4'].font = LABEL_FONT
+    ws['A4'].style = "label"
 
-    # Wrap lines
-    wrapped_lines = textwrap.wrap(description, width=150)
-    start_row = 5
-    col = 2  # column B
-    for i, line in enumerate(wrapped_lines):
-        cell = ws.cell(row=start_row + i, column=col, value=line)
-        # Additional styling if needed
+    # Drop a previous description merge so the new range can be applied cleanly
+    for merged in list(ws.merged_cells.ranges):
+        if merged.min_row == start_row and merged.min_col == col:
+            ws.unmerge_cells(merged.coord)
 
-def _write_company_description(writer, final_output):
+    description_cell = ws.cell(row=start_row, column=col, value=description)
+    description_cell.style = "data_tnr"
+    description_cell.alignment = WRAP_TOP_ALIGNMENT
+    ws.merge_cells(description_range)
+
+def _write_company_description(wb, final_output):
     # ...
     pass
 
-def _write_analyses_sheet(writer, final_output):
+def _write_analyses_sheet(wb, final_output):
     # ...
     pass
 
-def _write_profit_desc_sheet(writer, final_output):
+def _write_profit_desc_sheet(wb, final_output):
     # ...
     pass
 
-def _write_balance_sheet_sheet(writer, final_output):
+def _write_balance_sheet_sheet(wb, final_output):
     # ...
     pass
 
-def _write_studies_sheet(writer, final_output):
+def _write_studies_sheet(wb, final_output):
     # ...
     pass
 
-def _write_qualities_sheet(writer, final_output):
+def _write_qualities_sheet(wb, final_output):
     # ...
     pass
+
+# Sheet order in the generated workbook
+_SHEET_WRITERS = (
+    _write_summary_sheet,
+    _write_company_description,
+    _write_analyses_sheet,
+    _write_profit_desc_sheet,
+    _write_balance_sheet_sheet,
+    _write_studies_sheet,
+    _write_qualities_sheet,
+)
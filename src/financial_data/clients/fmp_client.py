@@ -1,12 +1,27 @@
 # src/financial_data/fmp_client.py
 
+import os
 import requests
 import logging
-from typing import Dict, List, Optional
+import time
+import threading
+import orjson
+from collections import deque
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession, DO_NOT_CACHE
+from typing import Dict, List, Optional, Tuple
 from ..models import CompanyProfile
 
 logger = logging.getLogger(__name__)
 
+# Seconds a short quote (or a failed quote lookup) is reused before refetching
+QUOTE_TTL = 60
+
+# Keep-alive connections held per host. Each symbol fetches its endpoints on
+# parallel threads and process_many runs several symbols at once; requests'
+# default of 10 would drop the extra connections and redo the TLS handshake.
+POOL_MAXSIZE = 32
+
 class FMPError(Exception):
     """Base exception for FMP API errors."""
     pass
@@ -14,14 +29,59 @@ class FMPError(Exception):
 class FMPClient:
     """Client for Financial Modeling Prep API."""
     
-    def __init__(self, api_key: str, base_url: str = "https://financialmodelingprep.com/api/v3"):
+    def __init__(self, api_key: str, base_url: str = "https://financialmodelingprep.com/api/v3",
+                 max_requests_per_minute: Optional[int] = None):
         self.api_key = api_key
         self.base_url = base_url
-        self.session = requests.Session()
-        logger.debug(f"FMPClient initialized with base_url={self.base_url}")
+        # Statements and profiles only change a few times a year, so responses
+        # are cached on disk for a day; the API key is kept out of the cache key
+        # and the stored responses. Quotes are live and always refetched.
+        self.session = CachedSession(
+            cache_name="fmp_cache",
+            backend="sqlite",
+            expire_after=86400,
+            ignored_parameters=["apikey"],
+            urls_expire_after={"*/quote-short/*": DO_NOT_CACHE},
+        )
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=POOL_MAXSIZE))
+        # Company metadata doesn't change within a run; keep it in memory per symbol
+        self._profile_cache: Dict[str, CompanyProfile] = {}
+        self._fiscal_year_end_cache: Dict[str, str] = {}
+        # Quotes are live, so they're only held briefly: symbol -> (fetched_at, price)
+        self._quote_cache: Dict[str, Tuple[float, Optional[float]]] = {}
+        # Optional client-side throttle for the FMP per-minute quota, shared by all
+        # threads using this client. Holds the send times of the last minute's requests.
+        self.max_requests_per_minute = max_requests_per_minute
+        self._request_times: deque = deque()
+        self._rate_lock = threading.Lock()
+        logger.debug("FMPClient initialized with base_url=%s", self.base_url)
+
+    def _acquire_request_slot(self) -> Optional[float]:
+        """Block until a request fits in the per-minute quota and return its reserved timestamp."""
+        if not self.max_requests_per_minute:
+            return None
+        while True:
+            with self._rate_lock:
+                now = time.monotonic()
+                while self._request_times and now - self._request_times[0] >= 60:
+                    self._request_times.popleft()
+                if len(self._request_times) < self.max_requests_per_minute:
+                    self._request_times.append(now)
+                    return now
+                wait = 60 - (now - self._request_times[0])
+            time.sleep(wait)
+
+    def _release_request_slot(self, slot: float) -> None:
+        """Give back a reserved slot for a request that never reached FMP."""
+        with self._rate_lock:
+            try:
+                self._request_times.remove(slot)
+            except ValueError:
+                pass  # already aged out of the window
 
-    def _get(self, endpoint: str, params: Optional[Dict] = None, base_url: Optional[str] = None) -> Dict:
-        """Make GET request to FMP API."""
+    def _get(self, endpoint: str, params: Optional[Dict] = None, base_url: Optional[str] = None,
+             force_refresh: bool = False) -> Dict:
+        """Make GET request to FMP API. force_refresh skips the on-disk cache and re-stores the response."""
         if params is None:
             params = {}
         params["apikey"] = self.api_key
@@ -29,28 +89,56 @@ class FMPClient:
         # Use the overridden base_url if provided, else default to self.base_url
         final_base_url = base_url if base_url else self.base_url
         url = f"{final_base_url}/{endpoint}"
-        logger.debug(f"Requesting {url} with params={params}")
+        logger.debug("Requesting %s with params=%s", url, params)
         
         try:
-            response = self.session.get(url, params=params)
-            logger.debug(f"Response status code: {response.status_code}")
+            response = None
+            if self.max_requests_per_minute and not force_refresh:
+                # Responses served from the on-disk cache don't count against the quota,
+                # so look there before reserving a slot that may have to wait for the
+                # window. requests-cache answers a miss (or an expired entry) with a 504.
+                cached = self.session.get(url, params=params, only_if_cached=True)
+                if cached.status_code != 504:
+                    response = cached
+            if response is None:
+                slot = self._acquire_request_slot()
+                try:
+                    response = self.session.get(url, params=params, force_refresh=force_refresh)
+                except requests.exceptions.ConnectionError:
+                    # The request never reached FMP, so it doesn't count against the quota
+                    if slot is not None:
+                        self._release_request_slot(slot)
+                    raise
+                # Another thread may have cached the same response while this one waited
+                if slot is not None and getattr(response, "from_cache", False):
+                    self._release_request_slot(slot)
+            logger.debug("Response status code: %s", response.status_code)
             response.raise_for_status()
-            json_data = response.json()
-            logger.debug(f"Response JSON (truncated): {str(json_data)[:200]}...")
+            # Decode the raw bytes directly; much faster than response.json() on
+            # the large statement payloads
+            json_data = orjson.loads(response.content)
+            # Only stringify the payload when someone is actually reading debug output
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response JSON (truncated): %s...", str(json_data)[:200])
             return json_data
         except requests.exceptions.RequestException as e:
             logger.exception(f"FMP API request failed for endpoint {endpoint}")
             raise FMPError(f"FMP API request failed: {str(e)}")
+        except orjson.JSONDecodeError as e:
+            logger.exception(f"FMP API returned invalid JSON for endpoint {endpoint}")
+            raise FMPError(f"FMP API returned invalid JSON: {str(e)}")
 
-    def get_company_profile(self, symbol: str) -> CompanyProfile:
+    def get_company_profile(self, symbol: str, force_refresh: bool = False) -> CompanyProfile:
         """Fetch company profile."""
+        if not force_refresh and symbol in self._profile_cache:
+            return self._profile_cache[symbol]
         logger.info(f"Fetching company profile for '{symbol}'")
-        data = self._get(f"profile/{symbol}")
+        data = self._get(f"profile/{symbol}", force_refresh=force_refresh)
         if not data or not isinstance(data, list):
             raise FMPError(f"Invalid profile data for {symbol}")
         
         profile = data[0]
-        return CompanyProfile(
+        company_profile = CompanyProfile(
             symbol=profile.get("symbol"),
             company_name=profile.get("companyName"),
             exchange=profile.get("exchange"),
@@ -58,33 +146,39 @@ class FMPClient:
             sector=profile.get("sector"),
             industry=profile.get("industry")
         )
+        self._profile_cache[symbol] = company_profile
+        return company_profile
 
-    def get_income_statement(self, symbol: str, period: str = "annual") -> List[Dict]:
+    def get_income_statement(self, symbol: str, period: str = "annual",
+                             force_refresh: bool = False) -> List[Dict]:
         """Fetch income statements."""
         logger.info(f"Fetching income statements for '{symbol}', period={period}")
-        return self._get(f"income-statement/{symbol}", {"period": period})
+        return self._get(f"income-statement/{symbol}", {"period": period}, force_refresh=force_refresh)
 
-    def get_balance_sheet(self, symbol: str, period: str = "annual") -> List[Dict]:
+    def get_balance_sheet(self, symbol: str, period: str = "annual",
+                          force_refresh: bool = False) -> List[Dict]:
         """Fetch balance sheet statements."""
         logger.info(f"Fetching balance sheet for '{symbol}', period={period}")
-        return self._get(f"balance-sheet-statement/{symbol}", {"period": period})
+        return self._get(f"balance-sheet-statement/{symbol}", {"period": period}, force_refresh=force_refresh)
 
-    def get_balance_sheet_as_reported(self, symbol: str, period: str = "annual") -> List[Dict]:
+    def get_balance_sheet_as_reported(self, symbol: str, period: str = "annual",
+                                      force_refresh: bool = False) -> List[Dict]:
         """Fetch balance sheet as reported."""
         logger.info(f"Fetching balance sheet as reported for '{symbol}', period={period}")
-        return self._get(f"balance-sheet-statement-as-reported/{symbol}", {"period": period})
+        return self._get(f"balance-sheet-statement-as-reported/{symbol}", {"period": period}, force_refresh=force_refresh)
 
-    def get_cash_flow_statement(self, symbol: str, period: str = "annual") -> List[Dict]:
+    def get_cash_flow_statement(self, symbol: str, period: str = "annual",
+                                force_refresh: bool = False) -> List[Dict]:
         """Fetch cash flow statements."""
         logger.info(f"Fetching cash flow statements for '{symbol}', period={period}")
-        return self._get(f"cash-flow-statement/{symbol}", {"period": period})
+        return self._get(f"cash-flow-statement/{symbol}", {"period": period}, force_refresh=force_refresh)
 
-    def get_key_metrics(self, symbol: str) -> List[Dict]:
+    def get_key_metrics(self, symbol: str, force_refresh: bool = False) -> List[Dict]:
         """Fetch key metrics."""
         logger.info(f"Fetching key metrics for '{symbol}'")
-        return self._get(f"key-metrics/{symbol}")
+        return self._get(f"key-metrics/{symbol}", force_refresh=force_refresh)
 
-    def get_revenue_segmentation(self, symbol: str) -> Dict[int, Dict[str, float]]:
+    def get_revenue_segmentation(self, symbol: str, force_refresh: bool = False) -> Dict[int, Dict[str, float]]:
         """Fetch revenue segmentation."""
         logger.info(f"Fetching revenue segmentation for '{symbol}'")
         endpoint = "revenue-product-segmentation"
@@ -96,33 +190,40 @@ class FMPClient:
             "period": "annual"
         }
         
-        data = self._get(endpoint, params=params, base_url=base_url_v4)
+        data = self._get(endpoint, params=params, base_url=base_url_v4, force_refresh=force_refresh)
         
         result = {}
         for entry in data:
             for date_str, segments in entry.items():
-                if date_str and segments:
-                    try:
-                        year = int(date_str.split('-')[0])
-                        if isinstance(segments, dict):
-                            result[year] = segments
-                    except ValueError:
-                        logger.warning(f"Invalid date format: {date_str}")
-                        continue
+                if not date_str or not segments or not isinstance(segments, dict):
+                    continue
+                # Dates are "YYYY-MM-DD"; the year prefix is all we need
+                year_str = date_str[:4]
+                if not year_str.isdigit():
+                    logger.warning(f"Invalid date format: {date_str}")
+                    continue
+                result[int(year_str)] = segments
         return result
 
-    def get_fiscal_year_end(self, symbol: str) -> Optional[str]:
+    def get_fiscal_year_end(self, symbol: str, force_refresh: bool = False) -> Optional[str]:
         """Fetch fiscal year end from company core information."""
-        logger.debug(f"Fetching fiscalYearEnd for '{symbol}' from /v4/company-core-information")
+        if not force_refresh and symbol in self._fiscal_year_end_cache:
+            return self._fiscal_year_end_cache[symbol]
+        logger.debug("Fetching fiscalYearEnd for '%s' from /v4/company-core-information", symbol)
         endpoint = "company-core-information"
         base_url_v4 = "https://financialmodelingprep.com/api/v4"
         params = {"symbol": symbol}
-        return self._get_fiscal_year_end(symbol, base_url_v4, endpoint, params)
+        fiscal_year_end = self._get_fiscal_year_end(symbol, base_url_v4, endpoint, params, force_refresh)
+        # Failed lookups return None and are retried on the next call
+        if fiscal_year_end is not None:
+            self._fiscal_year_end_cache[symbol] = fiscal_year_end
+        return fiscal_year_end
     
-    def _get_fiscal_year_end(self, symbol: str, base_url: str, endpoint: str, params: Dict) -> Optional[str]:
+    def _get_fiscal_year_end(self, symbol: str, base_url: str, endpoint: str, params: Dict,
+                             force_refresh: bool = False) -> Optional[str]:
         """Helper method to fetch fiscal year end."""
         try:
-            data = self._get(endpoint, params=params, base_url=base_url)
+            data = self._get(endpoint, params=params, base_url=base_url, force_refresh=force_refresh)
             if isinstance(data, list) and len(data) > 0:
                 return data[0].get("fiscalYearEnd")
             return None
@@ -130,13 +231,45 @@ class FMPClient:
             logger.error(f"Error fetching fiscalYearEnd for {symbol}: {e}")
             return None
 
-    def get_quote_short(self, symbol: str) -> Optional[float]:
+    def get_quote_short(self, symbol: str, force_refresh: bool = False) -> Optional[float]:
         """Fetch short quote price."""
-        logger.debug(f"Fetching short quote for '{symbol}'")
+        cached = self._quote_cache.get(symbol)
+        if not force_refresh and cached is not None and time.monotonic() - cached[0] < QUOTE_TTL:
+            return cached[1]
+
+        logger.debug("Fetching short quote for '%s'", symbol)
+        price = None
         try:
             data = self._get(f"quote-short/{symbol}")
             if isinstance(data, list) and len(data) > 0:
-                return data[0].get("price")
-        except FMPError:
-            pass
-        return None
+                price = data[0].get("price")
+        except FMPError as e:
+            logger.debug("Short quote for '%s' unavailable: %s", symbol, e)
+        # Failures are cached too, so retries within the TTL don't hit the API again
+        self._quote_cache[symbol] = (time.monotonic(), price)
+        return price
+
+
+# One client per (API key, rate limit) per process, so processors created one after
+# another keep the same connection pool, caches and request quota. Clients with
+# different rate limits throttle separately even for the same key, while FMP counts
+# the key's requests together, so use a single rate limit per key in a process.
+_shared_clients: Dict[Tuple[str, Optional[int]], FMPClient] = {}
+_shared_clients_lock = threading.Lock()
+# A forked child must not reuse the parent's pooled sockets
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_shared_clients.clear)
+
+def get_shared_client(api_key: str, max_requests_per_minute: Optional[int] = None) -> FMPClient:
+    """
+    Return this process's FMPClient for the API key and rate limit, creating it on first use.
+
+    A different max_requests_per_minute gets a separate client with its own quota.
+    """
+    key = (api_key, max_requests_per_minute)
+    with _shared_clients_lock:
+        client = _shared_clients.get(key)
+        if client is None:
+            client = FMPClient(api_key=api_key, max_requests_per_minute=max_requests_per_minute)
+            _shared_clients[key] = client
+        return client
@@ -1,45 +1,80 @@
 # src/financial_data/yahoo_client.py
 
+import functools
+import time
+import pandas as pd
 import yfinance as yf
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Seconds a range that includes the current year is reused; its high and low are still moving
+OPEN_RANGE_TTL = 15 * 60
+
 class YahooFinanceClient:
     """Client for Yahoo Finance data."""
 
     @staticmethod
-    def get_yearly_high(symbol: str, year: int) -> Optional[float]:
-        """Get yearly high price."""
-        start_date = f"{year}-01-01"
-        end_date = f"{year}-12-31"
+    def get_yearly_high_low(symbol: str, year: int) -> Tuple[Optional[float], Optional[float]]:
+        """Get (high, low) prices for one year; same download window and cache as the range lookup."""
+        return YahooFinanceClient.get_yearly_high_low_range(symbol, year, year).get(year, (None, None))
 
+    @staticmethod
+    def get_yearly_high_low_range(symbol: str, start_year: int,
+                                  end_year: int) -> Dict[int, Tuple[Optional[float], Optional[float]]]:
+        """Get (high, low) prices for every year in [start_year, end_year] from a single download."""
+        # Past years are final and cached for the life of the process. A range that
+        # includes the current year is keyed on a time bucket as well, so it is
+        # downloaded again once OPEN_RANGE_TTL has passed.
+        if end_year >= datetime.now().year:
+            ttl_bucket = int(time.monotonic() // OPEN_RANGE_TTL)
+        else:
+            ttl_bucket = 0
         try:
-            df = yf.download(symbol, start=start_date, end=end_date, progress=False)
-            if df.empty:
-                return None
-
-            yearly_high = df['High'].max()
-            return yearly_high.item() if yearly_high is not None else None
+            # Callers get their own dict; the cached value stays immutable
+            return dict(YahooFinanceClient._download_range(symbol, start_year, end_year, ttl_bucket))
         except Exception as e:
-            logging.error(f"Error fetching yearly high from Yahoo Finance: {e}")
-            return None
+            # Errors, including an empty download, propagate out of the lru_cache
+            # without being stored, so a later call retries the download
+            logger.error(f"Error fetching price history from Yahoo Finance: {e}")
+            return {}
 
     @staticmethod
-    def get_yearly_low(symbol: str, year: int) -> Optional[float]:
-        """Get yearly low price."""
-        start_date = f"{year}-01-01"
-        end_date = f"{year}-12-31"
+    @functools.lru_cache(maxsize=128)
+    def _download_range(symbol: str, start_year: int, end_year: int,
+                        ttl_bucket: int = 0) -> Tuple[Tuple[int, Tuple[float, float]], ...]:
+        """
+        Download daily prices for the year range and reduce them to (year, (high, low)) pairs.
 
-        try:
-            df = yf.download(symbol, start=start_date, end=end_date, progress=False)
-            if df.empty:
-                return None
+        ttl_bucket only takes part in the cache key.
+        """
+        # yfinance's end date is exclusive, so stop at the next Jan 1 to keep Dec 31 of the last year
+        df = yf.download(symbol, start=f"{start_year}-01-01", end=f"{end_year + 1}-01-01", progress=False)
+        if df.empty:
+            # yfinance logs download errors and returns an empty frame instead of
+            # raising; raise here so the empty result isn't cached
+            raise ValueError(f"No price data returned for {symbol} {start_year}-{end_year}")
 
-            yearly_low = df['Low'].min()
-            return yearly_low.item() if yearly_low is not None else None
-        except Exception as e:
-            logging.error(f"Error fetching yearly low from Yahoo Finance: {e}")
-            return None
\ No newline at end of file
+        highs, lows = df['High'], df['Low']
+        # Newer yfinance returns one column per ticker under each price field
+        if isinstance(highs, pd.DataFrame):
+            highs, lows = highs.iloc[:, 0], lows.iloc[:, 0]
+
+        yearly_high = highs.groupby(df.index.year).max()
+        yearly_low = lows.groupby(df.index.year).min()
+        return tuple(
+            (int(year), (float(yearly_high[year]), float(yearly_low[year])))
+            for year in yearly_high.index
+        )
+
+    @staticmethod
+    def get_yearly_high(symbol: str, year: int) -> Optional[float]:
+        """Get yearly high price."""
+        return YahooFinanceClient.get_yearly_high_low(symbol, year)[0]
+
+    @staticmethod
+    def get_yearly_low(symbol: str, year: int) -> Optional[float]:
+        """Get yearly low price."""
+        return YahooFinanceClient.get_yearly_high_low(symbol, year)[1]
@@ -1,11 +1,14 @@
 # src/financial_data/data_processor.py
 
 import os
-import json
 import logging
-from typing import Dict, List, Optional
+import orjson
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
-from financial_data.clients.fmp_client import FMPClient
+from financial_data.clients.fmp_client import get_shared_client
 from financial_data.clients.yahoo_client import YahooFinanceClient
 from financial_data.processors.data_fetcher import DataFetcher
 from financial_data.processors.data_transformer import DataTransformer
@@ -16,11 +19,49 @@ from utils.calculations import derive_fiscal_year
 
 logger = logging.getLogger(__name__)
 
+# Income statement series whose CAGRs make up the profit description characteristics
+_PROFIT_SERIES = [
+    "revenues",
+    "total_expenses",
+    "ebitda",
+    "free_cash_flow",
+    "operating_earnings",
+    "total_external_costs",
+    "earnings",
+    "cost_of_revenue",
+    "research_and_development",
+    "selling_marketing_general_admin",
+    "income_taxes",
+    "interest_and_other_income"
+]
+
+# Balance sheet totals whose CAGRs make up the balance sheet characteristics
+_BALANCE_SHEET_SERIES = [
+    "total_assets",
+    "total_liabilities",
+    "total_shareholders_equity"
+]
+
+def _field_array(statements: List[Dict], key: str) -> np.ndarray:
+    """One float per statement for `key`; a missing key counts as 0, a None value as NaN."""
+    return np.array([stmt.get(key, 0) for stmt in statements], dtype=float)
+
+def _safe_ratio(numerator: np.ndarray, denominator: np.ndarray, scale: float = 1) -> List[Optional[float]]:
+    """
+    Element-wise numerator / denominator * scale as plain floats, with None
+    wherever the denominator is zero or either side is missing.
+    """
+    ratio = np.full_like(numerator, np.nan)
+    np.divide(numerator, denominator, out=ratio, where=denominator != 0)
+    return [None if value != value else value for value in (ratio * scale).tolist()]
+
 class FinancialDataProcessor:
     """Orchestrates fetching, processing, and formatting of financial data."""
 
-    def __init__(self, api_key: str, output_dir: str = "output"):
-        self.fmp_client = FMPClient(api_key=api_key)
+    def __init__(self, api_key: str, output_dir: str = "output",
+                 max_requests_per_minute: Optional[int] = None):
+        # Shared per process, so new processors reuse open connections and cached responses
+        self.fmp_client = get_shared_client(api_key, max_requests_per_minute)
         self.yahoo_client = YahooFinanceClient()
         self.data_fetcher = DataFetcher(self.fmp_client, self.yahoo_client)
         self.data_transformer = DataTransformer()
@@ -33,7 +74,17 @@ class FinancialDataProcessor:
     def process_company_data(self, symbol: str, start_year: int) -> Metrics:
         """Processes data for a given company symbol."""
         try:
-            # 1. Fetch all data
+            # 1. Fetch all data. The end year isn't known until the fiscal year end
+            # arrives, but it's never past the current year, so the Yahoo price
+            # history downloads from start_year to now alongside the FMP requests.
+            # The pool is shut down without waiting: the download finishes in the
+            # background, and a symbol that fails before step 6 never waits for it.
+            pool = ThreadPoolExecutor(max_workers=1)
+            price_future = pool.submit(
+                self.yahoo_client.get_yearly_high_low_range,
+                symbol, start_year, datetime.now().year
+            )
+            pool.shutdown(wait=False)
             raw_data = self.data_fetcher.fetch_all_data(symbol)
 
             # 2. Transform company profile
@@ -51,6 +102,17 @@ class FinancialDataProcessor:
             revenue_segmentation = raw_data["revenue_segmentation"]
             current_stock_price = raw_data["current_stock_price"]
 
+            # Index statements by year once, so every per-year lookup below is a dict hit
+            income_by_year = self._index_by_year(income_statements)
+            balance_by_year = self._index_by_year(balance_sheets)
+            cash_flow_by_year = self._index_by_year(cash_flows)
+            key_metrics_by_year = self._index_by_year(key_metrics)
+
+            # Every year needs all three statements, so bail out before any work if one type is missing
+            if not income_by_year or not balance_by_year or not cash_flow_by_year:
+                logger.error(f"Required financial statements missing for {symbol}")
+                raise ValueError(f"{symbol}: required statements missing")
+
             # 5. Derive end year and validate
             end_year = most_recent_fiscal_year
             if start_year > end_year:
@@ -60,10 +122,11 @@ class FinancialDataProcessor:
             years_to_extract = list(range(start_year, end_year + 1))
             logger.info(f"Processing data for {symbol} from {start_year} to {end_year}")
 
-            # 6. Process YOY financial data
+            # 6. Process YOY financial data, using the prices fetched in step 1
+            price_ranges = price_future.result()
             yoy_financial_data = self._process_yoy_financial_data(
-                symbol, years_to_extract, income_statements, balance_sheets, 
-                cash_flows, key_metrics, revenue_segmentation
+                symbol, years_to_extract, income_by_year, balance_by_year,
+                cash_flow_by_year, key_metrics_by_year, price_ranges
             )
 
             # 7. Create company description
@@ -77,23 +140,23 @@ class FinancialDataProcessor:
             # 8. Process analyses section
             analyses = self._process_analyses(yoy_financial_data)
 
-            # 9. Process profit description
-            profit_description = self._process_profit_description(
-                income_statements,
+            # 9. Process profit description (and keep its characteristics for step 13)
+            profit_description, profit_description_char = self._process_profit_description(
+                income_by_year,
                 revenue_segmentation,
                 years_to_extract
             )
 
             # 10. Process balance sheet
             balance_sheet = self._process_balance_sheet(
-                balance_sheets,
+                balance_by_year,
                 years_to_extract
             )
 
             # 11. Process studies
             studies = self._process_studies(
-                balance_sheets,
-                income_statements,
+                balance_by_year,
+                income_by_year,
                 yoy_financial_data,
                 years_to_extract
             )
@@ -109,12 +172,6 @@ class FinancialDataProcessor:
             )
 
             # 13. Format data into JSON
-            profit_description_char = self._calculate_profit_description_characteristics(
-                income_statements,
-                revenue_segmentation,
-                years_to_extract
-            )
-
             final_output = self.json_formatter.format_to_json(
                 metrics, 
                 revenue_segmentation, 
@@ -131,35 +188,151 @@ class FinancialDataProcessor:
             logger.error(f"Error processing data for {symbol}: {e}")
             raise
 
-    def _find_statement_for_year(self, statements: List[Dict], year: int) -> Optional[Dict]:
+    def process_many(self, symbols: List[str], start_year: int, max_workers: int = 4,
+                     use_processes: bool = False) -> Dict[str, Metrics]:
+        """
+        Process several symbols concurrently.
+
+        The work is dominated by network latency, so by default symbols run on
+        a thread pool and share this processor's clients and caches. With
+        use_processes=True each worker process builds its own processor instead
+        (the API clients don't pickle), which also spreads the parsing and
+        pandas work across cores. Each symbol already issues its FMP requests
+        in parallel; if the processor was built with max_requests_per_minute,
+        the workers share that quota. Worker processes each get an even share,
+        so there are never more of them than requests allowed per minute.
+
+        Args:
+            symbols: Ticker symbols to process
+            start_year: First year to extract for every symbol
+            max_workers: Number of symbols processed at the same time
+            use_processes: Use a process pool rather than threads
+
+        Returns:
+            Dict mapping each symbol to its Metrics, in input order. The first
+            failure is re-raised once the running symbols finish.
+        """
+        if use_processes:
+            rate_limit = self.fmp_client.max_requests_per_minute
+            worker_rate_limit = None
+            if rate_limit:
+                # Every worker needs at least one request a minute; more workers
+                # than that would go over the quota between them
+                max_workers = min(max_workers, rate_limit)
+                worker_rate_limit = rate_limit // max_workers
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker_processor,
+                initargs=(self.fmp_client.api_key, self.output_dir, worker_rate_limit)
+            ) as pool:
+                results = pool.map(_process_in_worker, symbols, [start_year] * len(symbols))
+                return dict(zip(symbols, results))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = pool.map(lambda symbol: self.process_company_data(symbol, start_year), symbols)
+            return dict(zip(symbols, results))
+
+    def save_json_output(self, symbol: str, final_output: Dict, durable: bool = False,
+                         pretty: bool = False) -> str:
+        """
+        Save the consolidated output to {output_dir}/{symbol}_yoy_consolidated.json.
+
+        The JSON is written to a temporary file and renamed into place, so a
+        crash mid-write never leaves a truncated output file behind, and a
+        failed write removes the temporary file. With durable=True the file
+        is fsynced before the rename and its directory after it, so it
+        survives a power loss; that costs two disk flushes per symbol.
+
+        The output is compact unless pretty=True; run
+        `python -m financial_data.pretty <file>` to read a compact file.
+        """
+        out_file = os.path.join(self.output_dir, f"{symbol}_yoy_consolidated.json")
+        # Year-keyed sections use int keys, hence OPT_NON_STR_KEYS; numpy scalars
+        # coming out of the pandas-based analyses serialize natively
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(final_output, option=option)
+
+        # orjson already produced the bytes, so write them straight to the fd
+        # without another layer of Python file buffering
+        tmp_file = out_file + ".tmp"
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            try:
+                view = memoryview(data)
+                while view:
+                    written = os.write(fd, view)
+                    view = view[written:]
+                if durable:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, out_file)
+        except BaseException:
+            # Don't leave a partial temporary file next to the output
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
+            raise
+
+        # The rename is only durable once the directory entry is flushed too.
+        # Windows can't open a directory, so there's nothing to flush there.
+        if durable and hasattr(os, "O_DIRECTORY"):
+            dir_fd = os.open(self.output_dir, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+
+        logger.info(f"Saved JSON output to {out_file}")
+        return out_file
+
+    @staticmethod
+    def _index_by_year(statements: List[Dict]) -> Dict[int, Dict]:
         """
-        Find the financial statement for a specific year from a list of statements.
+        Index a list of statements by the year of their date.
 
         Args:
             statements: List of financial statements (income, balance sheet, cash flow, etc.)
+
+        Returns:
+            Dict mapping year to statement. The first statement seen for a year is kept.
+        """
+        statements_by_year = {}
+        for stmt in statements or []:
+            # FMP API returns date in format "YYYY-MM-DD"
+            year_str = (stmt.get("date") or "")[:4]
+            if year_str.isdigit():
+                statements_by_year.setdefault(int(year_str), stmt)
+        return statements_by_year
+
+    def _find_statement_for_year(self, statements_by_year: Dict[int, Dict], year: int) -> Optional[Dict]:
+        """
+        Find the financial statement for a specific year.
+
+        Args:
+            statements_by_year: Statements indexed by year (see _index_by_year)
             year: Year to find statement for
 
         Returns:
             Dict containing the statement data if found, None otherwise
         """
-        for stmt in statements:
-            # FMP API returns date in format "YYYY-MM-DD"
-            stmt_date = stmt.get("date", "")
-            if stmt_date.startswith(str(year)):
-                return stmt
-        
-        logger.debug(f"No statement found for year {year}")
-        return None
+        stmt = statements_by_year.get(year)
+        if stmt is None:
+            logger.debug(f"No statement found for year {year}")
+        return stmt
 
     def _process_yoy_financial_data(
         self,
         symbol: str,
         years: List[int],
-        income_statements: List[Dict],
-        balance_sheets: List[Dict],
-        cash_flows: List[Dict],
-        key_metrics: List[Dict],
-        revenue_segmentation: Dict[int, Dict[str, float]]
+        income_by_year: Dict[int, Dict],
+        balance_by_year: Dict[int, Dict],
+        cash_flow_by_year: Dict[int, Dict],
+        key_metrics_by_year: Dict[int, Dict],
+        price_ranges: Dict[int, Tuple[Optional[float], Optional[float]]]
     ) -> Dict[int, FinancialData]:
         """
         Process year-over-year financial data from various statements.
@@ -167,128 +340,105 @@ class FinancialDataProcessor:
         Args:
             symbol: Company ticker symbol
             years: List of years to process
-            income_statements: List of income statements
-            balance_sheets: List of balance sheets
-            cash_flows: List of cash flow statements
-            key_metrics: List of key metrics
-            revenue_segmentation: Revenue breakdown by segment
+            income_by_year: Income statements indexed by year
+            balance_by_year: Balance sheets indexed by year
+            cash_flow_by_year: Cash flow statements indexed by year
+            key_metrics_by_year: Key metrics indexed by year
+            price_ranges: Yearly (high, low) stock prices keyed by year
             
         Returns:
             Dict mapping years to FinancialData objects
         """
-        yoy_data = {}
-        
-        for year in years:
-            # Find statements for the year
-            income = self._find_statement_for_year(income_statements, year)
-            balance = self._find_statement_for_year(balance_sheets, year)
-            cash_flow = self._find_statement_for_year(cash_flows, year)
-            key_metric = self._find_statement_for_year(key_metrics, year)
-            
-            if not income:
-                logger.warning(f"No income statement found for {year} ({symbol})")
-                continue
-                
-            if not balance:
-                logger.warning(f"No balance sheet found for {year} ({symbol})")
-                continue
-                
-            if not cash_flow:
-                logger.warning(f"No cash flow statement found for {year} ({symbol})")
-                continue
+        # 1. Collect the statements for every year that has all three
+        available_years = income_by_year.keys() & balance_by_year.keys() & cash_flow_by_year.keys()
+        missing_years = [year for year in years if year not in available_years]
+        if missing_years:
+            logger.warning(
+                f"Skipping years {missing_years} for {symbol}: "
+                f"income, balance sheet or cash flow statement not found"
+            )
 
-            # Calculate operating metrics
-            total_revenue = income.get("revenue", 0)
-            shares_outstanding = income.get("weightedAverageShsOut", 0)
-            operating_income = income.get("operatingIncome", 0)
-            
-            # Calculate sales per share
-            sales_per_share = (total_revenue / shares_outstanding) if shares_outstanding else None
-            
-            # Calculate margins and rates
-            operating_margin = (operating_income / total_revenue * 100) if total_revenue else None
-            tax_expense = income.get("incomeTaxExpense", 0)
-            income_before_tax = income.get("incomeBeforeTax", 0)
-            tax_rate = (tax_expense / income_before_tax * 100) if income_before_tax else None
-            
-            # Calculate depreciation metrics
-            depreciation = income.get("depreciationAndAmortization", 0)
-            net_income = income.get("netIncome", 0)
-            depreciation_pct = (depreciation / net_income * 100) if net_income else None
-            
-            # Calculate ROE and ROC
-            avg_equity = (
-                balance.get("totalStockholdersEquity", 0) + 
-                self._get_prev_year_equity(balance_sheets, year)
-            ) / 2
-            
-            roe = (net_income / avg_equity * 100) if avg_equity else None
-            
-            total_capital = avg_equity + balance.get("totalDebt", 0)
-            roc = (operating_income / total_capital * 100) if total_capital else None
-            
-            # Calculate book value and buyback metrics
-            book_value = balance.get("totalStockholdersEquity", 0)
-            book_value_per_share = book_value / shares_outstanding if shares_outstanding else None
-            
-            buyback = abs(cash_flow.get("commonStockRepurchased", 0))
-            
-            # Calculate dividend metrics
-            dividends_paid = abs(cash_flow.get("dividendsPaid", 0))
-            dividends_per_share = income.get("dividendPerShare", 0)
-            dividend_yield = key_metric.get("dividendYield", 0) if key_metric else None
-            
+        statements = [
+            (year, income_by_year[year], balance_by_year[year], cash_flow_by_year[year],
+             key_metrics_by_year.get(year))
+            for year in years if year in available_years
+        ]
+
+        # 2. Compute the ratios for all years at once on aligned float arrays
+        incomes = [income for _, income, _, _, _ in statements]
+        balances = [balance for _, _, balance, _, _ in statements]
+
+        total_revenue = _field_array(incomes, "revenue")
+        shares_outstanding = _field_array(incomes, "weightedAverageShsOut")
+        operating_income = _field_array(incomes, "operatingIncome")
+        net_income = _field_array(incomes, "netIncome")
+        book_value = _field_array(balances, "totalStockholdersEquity")
+
+        # Average equity with the prior year's balance sheet (0 if there is none)
+        prev_equity = _field_array(
+            [balance_by_year.get(year - 1) or {} for year, _, _, _, _ in statements],
+            "totalStockholdersEquity"
+        )
+        avg_equity = (book_value + prev_equity) / 2
+        total_capital = avg_equity + _field_array(balances, "totalDebt")
+
+        sales_per_share = _safe_ratio(total_revenue, shares_outstanding)
+        operating_eps = _safe_ratio(operating_income, shares_outstanding)
+        book_value_per_share = _safe_ratio(book_value, shares_outstanding)
+        operating_margin = _safe_ratio(operating_income, total_revenue, 100)
+        tax_rate = _safe_ratio(
+            _field_array(incomes, "incomeTaxExpense"), _field_array(incomes, "incomeBeforeTax"), 100
+        )
+        depreciation_pct = _safe_ratio(_field_array(incomes, "depreciationAndAmortization"), net_income, 100)
+        roe = _safe_ratio(net_income, avg_equity, 100)
+        roc = _safe_ratio(operating_income, total_capital, 100)
+
+        # 3. Build one FinancialData per year; only object construction is left per row
+        rows = []
+        for i, (year, income, balance, cash_flow, key_metric) in enumerate(statements):
             # Get stock price metrics
-            price_high = self.yahoo_client.get_yearly_high(symbol, year)
-            price_low = self.yahoo_client.get_yearly_low(symbol, year)
-            pe_ratio = key_metric.get("peRatio", None) if key_metric else None
+            price_high, price_low = price_ranges.get(year, (None, None))
 
             # Create FinancialData object for the year
             financial_data = FinancialData(
-                net_profit=net_income,
+                net_profit=income.get("netIncome", 0),
                 diluted_eps=income.get("epsDiluted"),
-                operating_eps=income.get("operatingIncome") / shares_outstanding if shares_outstanding else None,
-                pe_ratio=pe_ratio,
+                operating_eps=operating_eps[i],
+                pe_ratio=key_metric.get("peRatio", None) if key_metric else None,
                 price_low=price_low,
                 price_high=price_high,
-                dividends_paid=dividends_paid,
-                dividends_per_share=dividends_per_share,
-                avg_dividend_yield=dividend_yield,
-                shares_outstanding=shares_outstanding,
-                buyback=buyback,
-                share_equity=book_value,
-                book_value_per_share=book_value_per_share,
+                dividends_paid=abs(cash_flow.get("dividendsPaid", 0)),
+                dividends_per_share=income.get("dividendPerShare", 0),
+                avg_dividend_yield=key_metric.get("dividendYield", 0) if key_metric else None,
+                shares_outstanding=income.get("weightedAverageShsOut", 0),
+                buyback=abs(cash_flow.get("commonStockRepurchased", 0)),
+                share_equity=balance.get("totalStockholdersEquity", 0),
+                book_value_per_share=book_value_per_share[i],
                 long_term_debt=balance.get("longTermDebt"),
-                roe=roe,
-                roc=roc,
+                roe=roe[i],
+                roc=roc[i],
                 # Additional calculated fields for analyses
-                revenues=total_revenue,
-                sales_per_share=sales_per_share,
-                operating_margin=operating_margin,
-                tax_rate=tax_rate,
-                depreciation=depreciation,
-                depreciation_pct=depreciation_pct
+                revenues=income.get("revenue", 0),
+                sales_per_share=sales_per_share[i],
+                operating_margin=operating_margin[i],
+                tax_rate=tax_rate[i],
+                depreciation=income.get("depreciationAndAmortization", 0),
+                depreciation_pct=depreciation_pct[i]
             )
             
-            yoy_data[year] = financial_data
+            rows.append((year, financial_data))
             logger.debug(f"Processed YOY data for {year}")
             
-        return yoy_data
-
-    def _get_prev_year_equity(self, balance_sheets: List[Dict], current_year: int) -> float:
-        """Helper to get previous year's equity for average calculation."""
-        prev_year_bs = self._find_statement_for_year(balance_sheets, current_year - 1)
-        if prev_year_bs:
-            return prev_year_bs.get("totalStockholdersEquity", 0)
-        return 0
+        return dict(rows)
 
     def _process_analyses(self, yoy_financial_data: Dict[int, FinancialData]) -> Analyses:
         """Process analyses section of the metrics."""
-        # Compute investment characteristics
-        earnings_analysis = self.metrics_calculator.compute_earnings_analysis(yoy_financial_data)
-        use_of_earnings = self.metrics_calculator.compute_use_of_earnings_analysis(yoy_financial_data)
-        sales_analysis = self.metrics_calculator.compute_sales_analysis(yoy_financial_data)
-        sales_analysis_5y = self.metrics_calculator.compute_sales_analysis_last_5_years(yoy_financial_data)
+        # Compute investment characteristics over one year-by-metric frame
+        yoy_frame = self.metrics_calculator.to_frame(yoy_financial_data)
+        earnings_analysis = self.metrics_calculator.compute_earnings_analysis(yoy_frame)
+        use_of_earnings = self.metrics_calculator.compute_use_of_earnings_analysis(yoy_frame)
+        sales_analysis = self.metrics_calculator.compute_sales_analysis(yoy_frame)
+        sales_analysis_5y = self.metrics_calculator.compute_sales_analysis_last_5_years(yoy_frame)
 
         # Create investment characteristics section
         investment_chars = InvestmentCharacteristicsSection(
@@ -299,9 +449,8 @@ class FinancialDataProcessor:
         )
 
         # Create analyses year-over-year data
-        analyses_yoy_data = {}
-        for year, data in yoy_financial_data.items():
-            analyses_yoy_data[str(year)] = AnalysesYoYData(
+        analyses_yoy_data = {
+            str(year): AnalysesYoYData(
                 revenues=data.revenues,
                 sales_per_share=data.sales_per_share,
                 operating_margin_pct=data.operating_margin,
@@ -309,6 +458,8 @@ class FinancialDataProcessor:
                 depreciation=data.depreciation,
                 depreciation_pct=data.depreciation_pct
             )
+            for year, data in yoy_financial_data.items()
+        }
 
         return Analyses(
             investment_characteristics=investment_chars,
@@ -316,78 +467,126 @@ class FinancialDataProcessor:
         )
 
     def _process_profit_description(self, 
-                                income_statements: List[Dict],
+                                income_by_year: Dict[int, Dict],
                                 revenue_segmentation: Dict[int, Dict[str, float]],
-                                years: List[int]) -> ProfitDescription:
-        """Process profit description section of the metrics."""
+                                years: List[int]) -> Tuple[ProfitDescription, Dict]:
+        """
+        Process profit description section of the metrics.
+
+        Each income statement is read once: the values that go into
+        ProfitDescriptionData also feed the CAGR time series.
+
+        Returns:
+            The ProfitDescription and the raw characteristics dict it was built
+            from (the JSON formatter needs the latter as well)
+        """
         profit_desc_data = {}
+        # CAGR series preallocated as (year, metric) arrays, columns in _PROFIT_SERIES
+        # order; only the first `rows` rows get filled
+        series_years = np.empty(len(years), dtype=np.int64)
+        series = np.full((len(years), len(_PROFIT_SERIES)), np.nan)
+        rows = 0
         
         for year in years:
-            income_stmt = self._find_statement_for_year(income_statements, year)
+            income_stmt = self._find_statement_for_year(income_by_year, year)
             if not income_stmt:
                 continue
 
+            revenues = income_stmt.get("revenue")
+            total_expenses = income_stmt.get("totalExpenses")
+            ebitda = income_stmt.get("ebitda")
+            free_cash_flow = income_stmt.get("freeCashFlow")
+            operating_earnings = income_stmt.get("operatingIncome")
+            total_external_costs = income_stmt.get("totalOtherIncomeExpensesNet")
+            earnings = income_stmt.get("netIncome")
+            cost_of_revenue = income_stmt.get("costOfRevenue")
+            research_and_development = income_stmt.get("researchAndDevelopment")
+            selling_marketing_general_admin = income_stmt.get("sellingAndMarketingExpenses")
+            income_taxes = income_stmt.get("incomeTaxExpense")
+            interest_and_other_income = income_stmt.get("interestIncome")
+
+            series_years[rows] = year
+            series[rows] = [
+                revenues, total_expenses, ebitda, free_cash_flow, operating_earnings,
+                total_external_costs, earnings, cost_of_revenue, research_and_development,
+                selling_marketing_general_admin, income_taxes, interest_and_other_income
+            ]
+            rows += 1
+
             # Create revenue breakdown
             revenue_breakdown = revenue_segmentation.get(year, {})
 
             # Create expenses breakdown
             expenses_breakdown = ExpensesBreakdown(
-                cost_of_revenue=income_stmt.get("costOfRevenue"),
-                research_and_development=income_stmt.get("researchAndDevelopment"),
-                selling_marketing_general_admin=income_stmt.get("sellingAndMarketingExpenses")
+                cost_of_revenue=cost_of_revenue,
+                research_and_development=research_and_development,
+                selling_marketing_general_admin=selling_marketing_general_admin
             )
 
             # Create external costs breakdown
             external_costs_breakdown = ExternalCostBreakdown(
-                income_taxes=income_stmt.get("incomeTaxExpense"),
-                interest_and_other_income=income_stmt.get("interestIncome")
+                income_taxes=income_taxes,
+                interest_and_other_income=interest_and_other_income
             )
 
             # Create profit description data
             profit_desc_data[str(year)] = ProfitDescriptionData(
-                total_revenues=income_stmt.get("revenue"),
+                total_revenues=revenues,
                 revenue_breakdown=revenue_breakdown,
-                total_expenses=income_stmt.get("totalExpenses"),
+                total_expenses=total_expenses,
                 expenses_breakdown=expenses_breakdown,
-                ebitda=income_stmt.get("ebitda"),
+                ebitda=ebitda,
                 amortization_depreciation=income_stmt.get("depreciationAndAmortization"),
-                free_cash_flow=income_stmt.get("freeCashFlow"),
+                free_cash_flow=free_cash_flow,
                 capex=income_stmt.get("capitalExpenditure"),
-                operating_earnings=income_stmt.get("operatingIncome"),
-                operating_earnings_percent_revenue=str(round(income_stmt.get("operatingIncomeRatio", 0) * 100, 2)) + "%",
-                total_external_costs=income_stmt.get("totalOtherIncomeExpensesNet"),
+                operating_earnings=operating_earnings,
+                operating_earnings_percent_revenue=(income_stmt.get("operatingIncomeRatio") or 0) * 100,
+                total_external_costs=total_external_costs,
                 external_cost_breakdown=external_costs_breakdown,
-                earnings=income_stmt.get("netIncome"),
-                earnings_percent_revenue=str(round(income_stmt.get("netIncomeRatio", 0) * 100, 2)) + "%",
-                dividend_paid=str(income_stmt.get("dividendsPaid", 0)),
+                earnings=earnings,
+                earnings_percent_revenue=(income_stmt.get("netIncomeRatio") or 0) * 100,
+                dividend_paid=income_stmt.get("dividendsPaid", 0),
                 dividend_paid_pct_fcf=None,  # Calculate if needed
                 share_buybacks_from_stmt_cf=income_stmt.get("stockRepurchased", 0),
                 net_biz_acquisition=income_stmt.get("acquisitionsNet", 0)
             )
 
-        # Calculate characteristics
+        # Calculate characteristics from the series gathered above
         characteristics = self._calculate_profit_description_characteristics(
-            income_statements,
-            revenue_segmentation,
-            years
+            series_years[:rows],
+            series[:rows],
+            revenue_segmentation
         )
 
-        return ProfitDescription(
+        profit_description = ProfitDescription(
             profit_description_characteristics=ProfitDescriptionCharacteristics(**characteristics),
             data=profit_desc_data
         )
+        return profit_description, characteristics
 
     def _process_balance_sheet(self, 
-                            balance_sheets: List[Dict],
+                            balance_by_year: Dict[int, Dict],
                             years: List[int]) -> BalanceSheet:
         """Process balance sheet section of the metrics."""
         balance_sheet_data = {}
+        # CAGR series preallocated as (year, metric) arrays, columns in
+        # _BALANCE_SHEET_SERIES order; only the first `rows` rows get filled
+        series_years = np.empty(len(years), dtype=np.int64)
+        series = np.full((len(years), len(_BALANCE_SHEET_SERIES)), np.nan)
+        rows = 0
         
         for year in years:
-            bs = self._find_statement_for_year(balance_sheets, year)
+            bs = self._find_statement_for_year(balance_by_year, year)
             if not bs:
                 continue
 
+            total_assets = bs.get("totalAssets")
+            total_liabilities = bs.get("totalLiabilities")
+            total_shareholders_equity = bs.get("totalStockholdersEquity")
+            series_years[rows] = year
+            series[rows] = [total_assets, total_liabilities, total_shareholders_equity]
+            rows += 1
+
             # Create assets breakdown
             assets_breakdown = AssetsBreakdown(
                 cash_and_cash_equivalents=bs.get("cashAndCashEquivalents"),
@@ -422,16 +621,16 @@ class FinancialDataProcessor:
 
             # Create balance sheet data
             balance_sheet_data[str(year)] = BalanceSheetData(
-                total_assets=bs.get("totalAssets"),
+                total_assets=total_assets,
                 assets_breakdown=assets_breakdown,
-                total_liabilities=bs.get("totalLiabilities"),
+                total_liabilities=total_liabilities,
                 liabilities_breakdown=liabilities_breakdown,
-                total_shareholders_equity=bs.get("totalStockholdersEquity"),
+                total_shareholders_equity=total_shareholders_equity,
                 shareholders_equity_breakdown=equity_breakdown
             )
 
-        # Calculate characteristics
-        characteristics = self._calculate_balance_sheet_characteristics(balance_sheets, years)
+        # Calculate characteristics from the series gathered above
+        characteristics = self._calculate_balance_sheet_characteristics(series_years[:rows], series[:rows])
 
         return BalanceSheet(
             balance_sheet_characteristics=BalanceSheetCharacteristics(**characteristics),
@@ -439,15 +638,15 @@ class FinancialDataProcessor:
         )
 
     def _process_studies(self,
-                        balance_sheets: List[Dict],
-                        income_statements: List[Dict],
+                        balance_by_year: Dict[int, Dict],
+                        income_by_year: Dict[int, Dict],
                         yoy_financial_data: Dict[int, FinancialData],
                         years: List[int]) -> Studies:
         """Process studies section of the metrics."""
         # Get most recent year's data
         latest_year = max(years)
-        latest_bs = self._find_statement_for_year(balance_sheets, latest_year)
-        latest_income = self._find_statement_for_year(income_statements, latest_year)
+        latest_bs = self._find_statement_for_year(balance_by_year, latest_year)
+        latest_income = self._find_statement_for_year(income_by_year, latest_year)
 
         if not (latest_bs and latest_income):
             return Studies()
@@ -498,51 +697,12 @@ class FinancialDataProcessor:
         )
 
     def _calculate_profit_description_characteristics(self,
-                                                income_statements: List[Dict],
-                                                revenue_segmentation: Dict[int, Dict[str, float]],
-                                                years: List[int]) -> Dict:
-        """Calculate profit description characteristics."""
-        # Extract time series for various metrics
-        metrics_series = {
-            "revenues": [],
-            "total_expenses": [],
-            "ebitda": [],
-            "free_cash_flow": [],
-            "operating_earnings": [],
-            "total_external_costs": [],
-            "earnings": [],
-            "cost_of_revenue": [],
-            "research_and_development": [],
-            "selling_marketing_general_admin": [],
-            "income_taxes": [],
-            "interest_and_other_income": []
-        }
-
-        # Populate time series data
-        for year in years:
-            stmt = self._find_statement_for_year(income_statements, year)
-            if not stmt:
-                continue
-
-            metrics_series["revenues"].append((year, stmt.get("revenue")))
-            metrics_series["total_expenses"].append((year, stmt.get("totalExpenses")))
-            metrics_series["ebitda"].append((year, stmt.get("ebitda")))
-            metrics_series["free_cash_flow"].append((year, stmt.get("freeCashFlow")))
-            metrics_series["operating_earnings"].append((year, stmt.get("operatingIncome")))
-            metrics_series["total_external_costs"].append((year, stmt.get("totalOtherIncomeExpensesNet")))
-            metrics_series["earnings"].append((year, stmt.get("netIncome")))
-            metrics_series["cost_of_revenue"].append((year, stmt.get("costOfRevenue")))
-            metrics_series["research_and_development"].append((year, stmt.get("researchAndDevelopment")))
-            metrics_series["selling_marketing_general_admin"].append((year, stmt.get("sellingAndMarketingExpenses")))
-            metrics_series["income_taxes"].append((year, stmt.get("incomeTaxExpense")))
-            metrics_series["interest_and_other_income"].append((year, stmt.get("interestIncome")))
-
+                                                series_years: np.ndarray,
+                                                series: np.ndarray,
+                                                revenue_segmentation: Dict[int, Dict[str, float]]) -> Dict:
+        """Calculate profit description characteristics from the (year, metric) income series."""
         # Calculate CAGR for each metric
-        characteristics = {}
-        for metric_name, series in metrics_series.items():
-            cagr = self.metrics_calculator.compute_cagr(series)
-            if cagr is not None:
-                characteristics[f"cagr_{metric_name}_percent"] = cagr
+        characteristics = self.metrics_calculator.compute_column_cagrs(series_years, series, _PROFIT_SERIES)
 
         # Calculate CAGR for revenue segmentation
         revenue_breakdown_cagr = self.metrics_calculator.compute_revenue_breakdown_cagr(revenue_segmentation)
@@ -557,31 +717,10 @@ class FinancialDataProcessor:
 
         return characteristics
 
-    def _calculate_balance_sheet_characteristics(self, balance_sheets: List[Dict], years: List[int]) -> Dict:
-        """Calculate balance sheet characteristics."""
-        # Extract time series for assets, liabilities, equity
-        metrics_series = {
-            "total_assets": [],
-            "total_liabilities": [],
-            "total_shareholders_equity": []
-        }
-
-        # Populate time series data
-        for year in years:
-            bs = self._find_statement_for_year(balance_sheets, year)
-            if not bs:
-                continue
-
-            metrics_series["total_assets"].append((year, bs.get("totalAssets")))
-            metrics_series["total_liabilities"].append((year, bs.get("totalLiabilities")))
-            metrics_series["total_shareholders_equity"].append((year, bs.get("totalStockholdersEquity")))
-
+    def _calculate_balance_sheet_characteristics(self, series_years: np.ndarray, series: np.ndarray) -> Dict:
+        """Calculate balance sheet characteristics from the (year, metric) balance sheet series."""
         # Calculate CAGR for each metric
-        characteristics = {}
-        for metric_name, series in metrics_series.items():
-            cagr = self.metrics_calculator.compute_cagr(series)
-            if cagr is not None:
-                characteristics[f"cagr_{metric_name}_percent"] = cagr
+        characteristics = self.metrics_calculator.compute_column_cagrs(series_years, series, _BALANCE_SHEET_SERIES)
 
         return characteristics
 
@@ -604,4 +743,21 @@ class FinancialDataProcessor:
         market_cap = latest_metrics.get("marketCap", 0)
         
         logger.debug(f"Market Cap extracted: {market_cap}")
-        return int(market_cap)
\ No newline at end of file
+        return int(market_cap)
+
+# One processor per worker process for process_many(..., use_processes=True)
+_worker_processor: Optional[FinancialDataProcessor] = None
+
+def _init_worker_processor(api_key: str, output_dir: str,
+                           max_requests_per_minute: Optional[int] = None) -> None:
+    """Process pool initializer: build this worker's processor and clients once."""
+    global _worker_processor
+    _worker_processor = FinancialDataProcessor(
+        api_key=api_key,
+        output_dir=output_dir,
+        max_requests_per_minute=max_requests_per_minute
+    )
+
+def _process_in_worker(symbol: str, start_year: int) -> Metrics:
+    """Process pool task: run one symbol on this worker's processor."""
+    return _worker_processor.process_company_data(symbol, start_year)
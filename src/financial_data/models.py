@@ -1,7 +1,12 @@
+import sys
 from dataclasses import dataclass, field
 from typing import Dict, Optional
 
-@dataclass
+# Every model uses __slots__ where the running Python supports
+# dataclass(slots=True) (3.10+): smaller instances and faster attribute access
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_SLOTS)
 class CompanyProfile:
     symbol: str
     company_name: str
@@ -10,7 +15,7 @@ class CompanyProfile:
     sector: str
     industry: str
 
-@dataclass
+@dataclass(**_SLOTS)
 class FinancialData:
     net_profit: Optional[float] = None
     diluted_eps: Optional[float] = None
@@ -28,37 +33,44 @@ class FinancialData:
     long_term_debt: Optional[float] = None
     roe: Optional[float] = None
     roc: Optional[float] = None
-
-@dataclass
+    # Per-year figures feeding the analyses section
+    revenues: Optional[float] = None
+    sales_per_share: Optional[float] = None
+    operating_margin: Optional[float] = None
+    tax_rate: Optional[float] = None
+    depreciation: Optional[float] = None
+    depreciation_pct: Optional[float] = None
+
+@dataclass(**_SLOTS)
 class CompanyDescription:
     fiscal_year_end: str  
     stock_price: float
     market_cap: int
     yoy_financial_data: Dict[str, FinancialData] = field(default_factory=dict)
 
-@dataclass
+@dataclass(**_SLOTS)
 class InvestmentCharacteristics:
     growth_rate_percent_operating_eps: Optional[float] = None
     quality_percent: Optional[float] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class UseOfEarningsAnalysis:
     avg_dividend_payout_percent: Optional[float] = None
     avg_stock_buyback_percent: Optional[float] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class SalesAnalysis:
     growth_rate_percent_revenues: Optional[float] = None
     growth_rate_percent_sales_per_share: Optional[float] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class InvestmentCharacteristicsSection:
     earnings_analysis: Optional[InvestmentCharacteristics] = None
     use_of_earnings_analysis: Optional[UseOfEarningsAnalysis] = None
     sales_analysis: Optional[SalesAnalysis] = None
     sales_analysis_last_5_years: Optional[SalesAnalysis] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class AnalysesYoYData:
     revenues: Optional[float]
     sales_per_share: Optional[float]
@@ -67,23 +79,23 @@ class AnalysesYoYData:
     depreciation: Optional[float]
     depreciation_pct: Optional[float]
 
-@dataclass
+@dataclass(**_SLOTS)
 class Analyses:
     investment_characteristics: Optional[InvestmentCharacteristicsSection] = None
     data: Dict[str, AnalysesYoYData] = field(default_factory=dict)
 
-@dataclass
+@dataclass(**_SLOTS)
 class ExpensesBreakdown:
     cost_of_revenue: Optional[float] = None
     research_and_development: Optional[float] = None
     selling_marketing_general_admin: Optional[float] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class ExternalCostBreakdown:
     income_taxes: Optional[float] = None
     interest_and_other_income: Optional[float] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProfitDescriptionData:
     total_revenues: Optional[float] = None
     revenue_breakdown: Dict[str, float] = field(default_factory=dict)
@@ -94,17 +106,19 @@ class ProfitDescriptionData:
     free_cash_flow: Optional[float] = None
     capex: Optional[float] = None
     operating_earnings: Optional[float] = None
-    operating_earnings_percent_revenue: Optional[str] = None
+    # Percent of revenue, not a ratio: 12.4 means 12.4%
+    operating_earnings_percent_revenue: Optional[float] = None
     total_external_costs: Optional[float] = None
     external_cost_breakdown: ExternalCostBreakdown = field(default_factory=ExternalCostBreakdown)
     earnings: Optional[float] = None
-    earnings_percent_revenue: Optional[str] = None
-    dividend_paid: Optional[str] = None
+    # Percent of revenue, not a ratio: 12.4 means 12.4%
+    earnings_percent_revenue: Optional[float] = None
+    dividend_paid: Optional[float] = None
     dividend_paid_pct_fcf: Optional[float] = None
     share_buybacks_from_stmt_cf: Optional[float] = None
     net_biz_acquisition: Optional[float] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProfitDescriptionCharacteristics:
     cagr_external_costs_income_taxes_percent: Optional[float] = None
     cagr_external_costs_interest_and_other_income_percent: Optional[float] = None
@@ -120,12 +134,12 @@ class ProfitDescriptionCharacteristics:
     cagr_research_and_development_percent: Optional[float] = None
     cagr_selling_marketing_general_admin_percent: Optional[float] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class ProfitDescription:
     profit_description_characteristics: Optional[ProfitDescriptionCharacteristics] = None
     data: Dict[str, ProfitDescriptionData] = field(default_factory=dict)
 
-@dataclass
+@dataclass(**_SLOTS)
 class AssetsBreakdown:
     cash_and_cash_equivalents: Optional[float] = None
     short_term_investment: Optional[float] = None
@@ -136,7 +150,7 @@ class AssetsBreakdown:
     other_non_current: Optional[float] = None
     long_term_equity_investment: Optional[float] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class LiabilitiesBreakdown:
     accounts_payable: Optional[float] = None
     tax_payables: Optional[float] = None
@@ -147,14 +161,14 @@ class LiabilitiesBreakdown:
     other_non_current_liabilities: Optional[float] = None
     capital_lease_obligations: Optional[float] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class ShareholdersEquityBreakdown:
     common_stock: Optional[float] = None
     additional_paid_in_capital: Optional[float] = None
     retained_earnings: Optional[float] = None
     accum_other_comprehensive_income_loss: Optional[float] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class BalanceSheetData:
     total_assets: Optional[float] = None
     assets_breakdown: AssetsBreakdown = field(default_factory=AssetsBreakdown)
@@ -163,18 +177,18 @@ class BalanceSheetData:
     total_shareholders_equity: Optional[float] = None
     shareholders_equity_breakdown: ShareholdersEquityBreakdown = field(default_factory=ShareholdersEquityBreakdown)
 
-@dataclass
+@dataclass(**_SLOTS)
 class BalanceSheetCharacteristics:
     cagr_total_assets_percent: Optional[float] = None
     cagr_total_liabilities_percent: Optional[float] = None
     cagr_total_shareholders_equity_percent: Optional[float] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class BalanceSheet:
     balance_sheet_characteristics: Optional[BalanceSheetCharacteristics] = None
     data: Dict[str, BalanceSheetData] = field(default_factory=dict)
 
-@dataclass
+@dataclass(**_SLOTS)
 class AnalysisOfDebtLevels:
     total_debt: Optional[float] = None
     total_capital: Optional[float] = None
@@ -188,14 +202,14 @@ class AnalysisOfDebtLevels:
     addback: Optional[float] = None
     years_payback: Optional[float] = None
 
-@dataclass
+@dataclass(**_SLOTS)
 class Studies:
     total_debt_capital: AnalysisOfDebtLevels = field(default_factory=AnalysisOfDebtLevels)
     long_term_debt: AnalysisOfDebtLevels = field(default_factory=AnalysisOfDebtLevels)
     net_income_payback: AnalysisOfDebtLevels = field(default_factory=AnalysisOfDebtLevels)
     addback_net_inc_payback: AnalysisOfDebtLevels = field(default_factory=AnalysisOfDebtLevels)
 
-@dataclass
+@dataclass(**_SLOTS)
 class Metrics:
     company_profile: CompanyProfile
     company_description: CompanyDescription
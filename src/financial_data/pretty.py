@@ -0,0 +1,22 @@
+# src/financial_data/pretty.py
+
+import sys
+import orjson
+
+
+def pretty_print(path: str) -> None:
+    """Print a compact consolidated JSON file with 2-space indentation."""
+    with open(path, "rb") as f:
+        data = orjson.loads(f.read())
+    sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+
+
+def main():
+    if len(sys.argv) != 2:
+        print("Usage: python -m financial_data.pretty path/to/file.json", file=sys.stderr)
+        sys.exit(1)
+    pretty_print(sys.argv[1])
+
+
+if __name__ == "__main__":
+    main()
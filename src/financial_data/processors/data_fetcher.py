@@ -1,6 +1,7 @@
 # src/financial_data/processors/data_fetcher.py
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 
 from ..clients.fmp_client import FMPClient, FMPError
@@ -17,12 +18,31 @@ class DataFetcher:
         self.yahoo_client = yahoo_client
         logger.debug("DataFetcher initialized.")
 
-    def fetch_all_data(self, symbol: str) -> Dict:
-        """Fetches all necessary data for the given symbol."""
+    def fetch_all_data(self, symbol: str, force_refresh: bool = False) -> Dict:
+        """Fetches all necessary data for the given symbol. force_refresh bypasses the FMP response caches."""
         try:
-            # Get the raw profile first
-            profile = self.fmp_client.get_company_profile(symbol)
-            
+            # The FMP requests are independent and I/O bound, so they run
+            # concurrently; total latency is roughly the slowest call rather
+            # than the sum of all of them.
+            requests_by_key = {
+                "profile": (self.fmp_client.get_company_profile, (symbol, force_refresh)),
+                "fiscal_year_end": (self.fmp_client.get_fiscal_year_end, (symbol, force_refresh)),
+                "income_statements": (self.fmp_client.get_income_statement, (symbol, "annual", force_refresh)),
+                "balance_sheets": (self.fmp_client.get_balance_sheet, (symbol, "annual", force_refresh)),
+                "cash_flows": (self.fmp_client.get_cash_flow_statement, (symbol, "annual", force_refresh)),
+                "key_metrics": (self.fmp_client.get_key_metrics, (symbol, force_refresh)),
+                "revenue_segmentation": (self.fmp_client.get_revenue_segmentation, (symbol, force_refresh)),
+                "current_stock_price": (self.fmp_client.get_quote_short, (symbol, force_refresh)),
+            }
+            with ThreadPoolExecutor(max_workers=len(requests_by_key)) as pool:
+                futures = {
+                    key: pool.submit(func, *args)
+                    for key, (func, args) in requests_by_key.items()
+                }
+                results = {key: future.result() for key, future in futures.items()}
+
+            profile = results["profile"]
+
             # Convert CompanyProfile to dictionary for consistency
             profile_dict = {
                 "symbol": profile.symbol,
@@ -33,27 +53,19 @@ class DataFetcher:
                 "industry": profile.industry
             }
 
-            fiscal_year_end = self.fmp_client.get_fiscal_year_end(symbol)
-            income_statements = self.fmp_client.get_income_statement(symbol, period="annual")
-            balance_sheets = self.fmp_client.get_balance_sheet(symbol, period="annual")
-            cash_flows = self.fmp_client.get_cash_flow_statement(symbol, period="annual")
-            key_metrics = self.fmp_client.get_key_metrics(symbol)
-            revenue_segmentation = self.fmp_client.get_revenue_segmentation(symbol)
-            current_stock_price = self.fmp_client.get_quote_short(symbol) or 0.0
-
             data = {
                 "profile": profile_dict,
-                "fiscal_year_end": fiscal_year_end,
-                "income_statements": income_statements,
-                "balance_sheets": balance_sheets,
-                "cash_flows": cash_flows,
-                "key_metrics": key_metrics,
-                "revenue_segmentation": revenue_segmentation,
-                "current_stock_price": current_stock_price
+                "fiscal_year_end": results["fiscal_year_end"],
+                "income_statements": results["income_statements"],
+                "balance_sheets": results["balance_sheets"],
+                "cash_flows": results["cash_flows"],
+                "key_metrics": results["key_metrics"],
+                "revenue_segmentation": results["revenue_segmentation"],
+                "current_stock_price": results["current_stock_price"] or 0.0
             }
             logger.info(f"All data fetched for symbol: {symbol}")
             return data
 
         except FMPError as e:
             logger.error(f"Failed to fetch data for {symbol}: {e}")
-            raise
\ No newline at end of file
+            raise
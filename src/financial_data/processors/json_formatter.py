@@ -7,6 +7,10 @@ from financial_data.models import Metrics
 
 logger = logging.getLogger(__name__)
 
+def _format_pct(value):
+    """Renders a percentage stored as percent (12.34) as "12.34%", keeping None as None."""
+    return f"{value:.2f}%" if value is not None else None
+
 class JSONFormatter:
     """Formats Metrics dataclass into the desired JSON structure."""
 
@@ -109,14 +113,14 @@ class JSONFormatter:
                         "free_cash_flow": data.free_cash_flow,
                         "capex": data.capex,
                         "operating_earnings": data.operating_earnings,
-                        "operating_earnings_percent_revenue": data.operating_earnings_percent_revenue,
+                        "operating_earnings_percent_revenue": _format_pct(data.operating_earnings_percent_revenue),
                         "external_costs": {
                             "total_external_costs": data.external_costs.get("total_external_costs", "0.00"),
                             "breakdown": data.external_costs.get("breakdown", {})
                         },
                         "earnings": data.earnings,
-                        "earnings_percent_revenue": data.earnings_percent_revenue,
-                        "dividend_paid": data.dividend_paid,
+                        "earnings_percent_revenue": _format_pct(data.earnings_percent_revenue),
+                        "dividend_paid": str(data.dividend_paid) if data.dividend_paid is not None else None,
                         "dividend_paid_pct_fcf": data.dividend_paid_pct_fcf,
                         "share_buybacks_from_stmt_cf": data.share_buybacks_from_stmt_cf,
                         "net_biz_acquisition": data.net_biz_acquisition
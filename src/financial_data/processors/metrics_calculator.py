@@ -1,13 +1,19 @@
 # src/financial_data/processors/metrics_calculator.py
 
 import logging
+from dataclasses import fields
 from typing import Dict, List, Tuple, Optional
 
+import numpy as np
+import pandas as pd
+
 from financial_data.models import FinancialData
-from utils.calculations import calculate_cagr
+from utils.calculations import calculate_cagr, calculate_cagr_columns, calculate_cagr_series
 
 logger = logging.getLogger(__name__)
 
+_FINANCIAL_DATA_COLUMNS = [f.name for f in fields(FinancialData)]
+
 class MetricsCalculator:
     """Calculates financial metrics based on transformed data."""
 
@@ -18,77 +24,107 @@ class MetricsCalculator:
         """Calculates CAGR for given values."""
         return calculate_cagr(values_by_year) * 100 if values_by_year else None
 
-    def compute_earnings_analysis(self, yoy_data: Dict[int, FinancialData]) -> Dict:
+    def compute_series_cagr(self, values: pd.Series) -> Optional[float]:
+        """Calculates CAGR (percent) for a year-indexed series."""
+        cagr = calculate_cagr_series(values)
+        return cagr * 100 if cagr is not None else None
+
+    def compute_column_cagrs(self, years: np.ndarray, values: np.ndarray, columns: List[str]) -> Dict[str, float]:
+        """
+        Calculates CAGR (percent) for every column of a (year, metric) array,
+        keyed as cagr_{column}_percent. Columns without a CAGR are left out.
+        """
+        # A single year (new listing, partial data) has no growth to measure
+        if len(years) < 2:
+            return {}
+        # All columns in one vectorized pass
+        cagrs = calculate_cagr_columns(years, values)
+        return {
+            f"cagr_{column}_percent": cagr * 100
+            for column, cagr in zip(columns, cagrs.tolist())
+            if cagr == cagr
+        }
+
+    @staticmethod
+    def to_frame(yoy_data: Dict[int, FinancialData]) -> pd.DataFrame:
+        """
+        Converts year-keyed FinancialData into a DataFrame with one row per year
+        (sorted ascending) and one float column per FinancialData field.
+        Missing values become NaN.
+        """
+        frame = pd.DataFrame(
+            [[getattr(data, column) for column in _FINANCIAL_DATA_COLUMNS] for data in yoy_data.values()],
+            index=list(yoy_data.keys()),
+            columns=_FINANCIAL_DATA_COLUMNS,
+            dtype=float,
+        )
+        return frame.sort_index()
+
+    @staticmethod
+    def _nonzero(column: pd.Series) -> pd.Series:
+        """Drops missing and zero values, like an `if value` filter."""
+        return column[column.notna() & (column != 0)]
+
+    def _column_cagr(self, column: pd.Series) -> Optional[float]:
+        """CAGR over the non-zero values of a year-indexed column, None if fewer than two."""
+        return self._values_cagr(self._nonzero(column))
+
+    def _values_cagr(self, values: pd.Series) -> Optional[float]:
+        """CAGR over an already-filtered year-indexed series, None if fewer than two values."""
+        if len(values) < 2:
+            return None
+        return self.compute_series_cagr(values)
+
+    def compute_earnings_analysis(self, yoy_frame: pd.DataFrame) -> Dict:
         """Computes earnings analysis metrics."""
         earnings_analysis = {}
+        # Filtered once, shared by the CAGR and the quality ratio
+        operating_eps_values = self._nonzero(yoy_frame["operating_eps"])
 
         # CAGR of Operating EPS
-        ops_eps_pairs = [(year, data.operating_eps) for year, data in yoy_data.items() if data.operating_eps]
-        earnings_analysis["growth_rate_percent_operating_eps"] = self.compute_cagr(sorted(ops_eps_pairs)) if len(ops_eps_pairs) >= 2 else None
+        earnings_analysis["growth_rate_percent_operating_eps"] = self._values_cagr(operating_eps_values)
 
         # Quality Percent
-        diluted_eps_values = [data.diluted_eps for data in yoy_data.values() if data.diluted_eps]
-        operating_eps_values = [data.operating_eps for data in yoy_data.values() if data.operating_eps]
-        if diluted_eps_values and operating_eps_values:
-            avg_diluted_eps = sum(diluted_eps_values) / len(diluted_eps_values)
-            avg_operating_eps = sum(operating_eps_values) / len(operating_eps_values)
+        diluted_eps_values = self._nonzero(yoy_frame["diluted_eps"])
+        if len(diluted_eps_values) and len(operating_eps_values):
+            avg_diluted_eps = float(diluted_eps_values.mean())
+            avg_operating_eps = float(operating_eps_values.mean())
             earnings_analysis["quality_percent"] = round((avg_diluted_eps / avg_operating_eps) * 100, 2) if avg_operating_eps else None
 
         return earnings_analysis
 
-    def compute_use_of_earnings_analysis(self, yoy_data: Dict[int, FinancialData]) -> Dict:
+    def compute_use_of_earnings_analysis(self, yoy_frame: pd.DataFrame) -> Dict:
         """Computes use of earnings analysis metrics."""
         use_of_earnings = {}
 
         # Avg Dividend Payout %
-        dividend_payouts = [
-            (data.dividends_per_share / data.operating_eps) * 100
-            for data in yoy_data.values()
-            if data.dividends_per_share and data.operating_eps
-        ]
-        if dividend_payouts:
-            use_of_earnings["avg_dividend_payout_percent"] = round(sum(dividend_payouts) / len(dividend_payouts), 2)
+        dividends_per_share = yoy_frame["dividends_per_share"]
+        operating_eps = yoy_frame["operating_eps"]
+        paid = dividends_per_share.notna() & (dividends_per_share != 0) & operating_eps.notna() & (operating_eps != 0)
+        if paid.any():
+            dividend_payouts = dividends_per_share[paid] / operating_eps[paid] * 100
+            use_of_earnings["avg_dividend_payout_percent"] = round(float(dividend_payouts.mean()), 2)
 
         # Avg Stock Buyback %
-        buybacks = [data.buyback for data in yoy_data.values() if data.buyback]
-        net_profits = [data.net_profit for data in yoy_data.values() if data.net_profit]
-        if buybacks and net_profits:
-            total_buyback = sum(buybacks)
-            total_net_profit = sum(net_profits)
+        buybacks = self._nonzero(yoy_frame["buyback"])
+        net_profits = self._nonzero(yoy_frame["net_profit"])
+        if len(buybacks) and len(net_profits):
+            total_buyback = float(buybacks.sum())
+            total_net_profit = float(net_profits.sum())
             use_of_earnings["avg_stock_buyback_percent"] = round((total_buyback / total_net_profit) * 100, 2) if total_net_profit else None
 
         return use_of_earnings
 
-    def compute_sales_analysis(self, yoy_data: Dict[int, FinancialData]) -> Dict:
+    def compute_sales_analysis(self, yoy_frame: pd.DataFrame) -> Dict:
         """Computes sales analysis metrics."""
-        sales_analysis = {}
-
-        # CAGR of Revenues
-        rev_pairs = [(year, data.revenues) for year, data in yoy_data.items() if data.revenues]
-        sales_analysis["growth_rate_percent_revenues"] = self.compute_cagr(sorted(rev_pairs)) if len(rev_pairs) >= 2 else None
-
-        # CAGR of Sales per Share
-        sps_pairs = [(year, data.sales_per_share) for year, data in yoy_data.items() if data.sales_per_share]
-        sales_analysis["growth_rate_percent_sales_per_share"] = self.compute_cagr(sorted(sps_pairs)) if len(sps_pairs) >= 2 else None
-
-        return sales_analysis
+        return {
+            "growth_rate_percent_revenues": self._column_cagr(yoy_frame["revenues"]),
+            "growth_rate_percent_sales_per_share": self._column_cagr(yoy_frame["sales_per_share"]),
+        }
 
-    def compute_sales_analysis_last_5_years(self, yoy_data: Dict[int, FinancialData]) -> Dict:
+    def compute_sales_analysis_last_5_years(self, yoy_frame: pd.DataFrame) -> Dict:
         """Computes sales analysis metrics for the last 5 years."""
-        sales_analysis_5y = {}
-
-        sorted_years = sorted(yoy_data.keys())
-        last_5_years = sorted_years[-5:]
-
-        # CAGR of Revenues for last 5 years
-        rev_pairs_5y = [(year, yoy_data[year].revenues) for year in last_5_years if yoy_data[year].revenues]
-        sales_analysis_5y["growth_rate_percent_revenues"] = self.compute_cagr(sorted(rev_pairs_5y)) if len(rev_pairs_5y) >= 2 else None
-
-        # CAGR of Sales per Share for last 5 years
-        sps_pairs_5y = [(year, yoy_data[year].sales_per_share) for year in last_5_years if yoy_data[year].sales_per_share]
-        sales_analysis_5y["growth_rate_percent_sales_per_share"] = self.compute_cagr(sorted(sps_pairs_5y)) if len(sps_pairs_5y) >= 2 else None
-
-        return sales_analysis_5y
+        return self.compute_sales_analysis(yoy_frame.tail(5))
 
     def compute_revenue_breakdown_cagr(self, revenue_segmentation: Dict[int, Dict[str, float]]) -> Dict[str, Optional[float]]:
         """Computes CAGR for each revenue segment."""
@@ -98,9 +134,15 @@ class MetricsCalculator:
         for segments_dict in revenue_segmentation.values():
             segments.update(segments_dict.keys())
 
+        # FMP lists segmentation newest first; order the years once for every segment
+        sorted_years = sorted(revenue_segmentation)
+
         for segment in segments:
-            segment_values = [(year, segments_dict.get(segment)) for year, segments_dict in revenue_segmentation.items() if segments_dict.get(segment)]
-            segment_values = sorted(segment_values)
+            segment_values = [
+                (year, revenue_segmentation[year][segment])
+                for year in sorted_years
+                if revenue_segmentation[year].get(segment)
+            ]
             if len(segment_values) >= 2:
                 cagr = calculate_cagr(segment_values) * 100
                 revenues_breakdown_cagr[f"cagr_revenues_{segment}_percent"] = round(cagr, 2)
@@ -1,6 +1,5 @@
 # src/main.py
 import sys
-import os
 import logging
 
 from .utils.config import Config
@@ -61,11 +60,9 @@ def main():
     # 8) Insert the forum_summary into final_output (like "qualities")
     final_output["qualities"] = forum_summary
 
-    # 9) Save updated final_output
-    yoy_path = os.path.join("output", f"{symbol}_yoy_consolidated.json")
-    with open(yoy_path, "w") as f:
-        import json
-        json.dump(final_output, f, indent=4)
+    # 9) Save updated final_output (orjson, written atomically like the processor's own output).
+    # The file is compact JSON; `python -m financial_data.pretty <file>` prints it indented.
+    yoy_path = processor.save_json_output(symbol, final_output)
     logger.info(f"Updated final output with forum summary in {yoy_path}")
 
     # 10) Generate Excel
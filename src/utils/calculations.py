@@ -2,6 +2,7 @@
 
 import logging
 from typing import List, Tuple, Optional
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
@@ -65,6 +66,56 @@ def calculate_cagr(values_by_year: List[Tuple[int, float]], verbose: bool = Fals
         logger.error(f"Error calculating CAGR: {e}")
         return None
 
+def calculate_cagr_series(values: pd.Series) -> Optional[float]:
+    """
+    Calculate CAGR from a year-indexed series, following the same rules as
+    calculate_cagr but on the underlying arrays instead of (year, value) tuples.
+
+    Args:
+        values: Series indexed by year (ascending); missing values are NaN
+
+    Returns:
+        CAGR as a decimal, or None if not calculable
+    """
+    if len(values) < 2:
+        logger.debug("Insufficient data points to calculate CAGR.")
+        return None
+
+    cagr = calculate_cagr_columns(values.index.to_numpy(), values.to_numpy(dtype=float)[:, None])[0]
+    return None if np.isnan(cagr) else float(cagr)
+
+def calculate_cagr_columns(years: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Calculate CAGR for every column of a (years x metrics) array at once,
+    following the same rules as calculate_cagr.
+
+    Args:
+        years: Years in ascending order, one per row of `values`
+        values: 2-D float array, one column per metric; missing values are NaN
+
+    Returns:
+        1-D array with one CAGR (as a decimal) per column, NaN where not calculable
+    """
+    cagrs = np.full(values.shape[1], np.nan)
+    if len(years) < 2 or years[-1] - years[0] <= 0:
+        return cagrs
+
+    # Each column starts from its first positive value (NaN compares False)
+    positive = values > 0
+    start = positive.argmax(axis=0)
+    columns = np.arange(values.shape[1])
+    begin_values = values[start, columns]
+    end_values = values[-1]
+    periods = (years[-1] - years[start]).astype(float)
+
+    valid = np.flatnonzero(positive.any(axis=0) & (end_values > 0) & (periods > 0))
+    growth = (end_values[valid] / begin_values[valid]).tolist()
+    exponents = (1 / periods[valid]).tolist()
+    # The power is taken on Python floats: NumPy's vectorized pow can differ from
+    # calculate_cagr in the last bit
+    cagrs[valid] = [g ** e - 1 for g, e in zip(growth, exponents)]
+    return cagrs
+
 def derive_fiscal_year(fiscal_year_end: str) -> int:
     """
     Determine the most recent completed fiscal year given fiscal year end date.
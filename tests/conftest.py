@@ -0,0 +1,7 @@
+# tests/conftest.py
+
+import sys
+from pathlib import Path
+
+# Modules import each other as top-level packages (financial_data, utils, excel)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
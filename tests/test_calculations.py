@@ -0,0 +1,116 @@
+# tests/test_calculations.py
+
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.calculations import calculate_cagr, calculate_cagr_columns, calculate_cagr_series
+
+
+def _scalar_cagr(years, column):
+    """
+    Reference result from calculate_cagr for one column.
+
+    The vectorized functions encode a missing value as NaN, where the
+    (year, value) lists fed to calculate_cagr carry None. calculate_cagr
+    can't compare a missing end value (None <= 0 raises), so that case has no
+    CAGR, which the vectorized code reports as NaN.
+    """
+    values = [None if math.isnan(v) else v for v in column]
+    if values[-1] is None:
+        return None
+    return calculate_cagr(list(zip(years, values)))
+
+
+def _assert_columns_match(years, columns):
+    years = np.asarray(years)
+    values = np.array(columns, dtype=float).T
+    cagrs = calculate_cagr_columns(years, values)
+    assert cagrs.shape == (len(columns),)
+    for column, cagr in zip(columns, cagrs.tolist()):
+        expected = _scalar_cagr(years.tolist(), [float(v) for v in column])
+        if expected is None:
+            assert math.isnan(cagr), column
+        else:
+            # Bit-for-bit, not approximately: both paths must produce the same float
+            assert cagr == expected, column
+
+
+def test_columns_match_scalar_for_regular_growth():
+    _assert_columns_match(
+        [2018, 2019, 2020, 2021],
+        [[100.0, 110.0, 121.0, 133.1], [5.0, 4.0, 3.0, 2.5], [1.0, 1.0, 1.0, 1.0]],
+    )
+
+
+@pytest.mark.parametrize("column", [
+    [0.0, 0.0, 50.0, 80.0],       # zero start: CAGR starts at the first positive year
+    [-10.0, 20.0, 30.0, 40.0],    # negative start
+    [-10.0, -5.0, 0.0, -1.0],     # never positive
+    [10.0, 20.0, 30.0, 0.0],      # zero end
+    [10.0, 20.0, 30.0, -5.0],     # negative end
+    [float("nan"), 20.0, 30.0, 45.0],                  # missing start
+    [float("nan"), float("nan"), 30.0, 45.0],          # several missing at the start
+    [10.0, float("nan"), 30.0, 45.0],                  # missing in the middle
+    [10.0, 20.0, 30.0, float("nan")],                  # missing end
+    [float("nan"), float("nan"), float("nan"), 7.0],   # only the last year present
+    [float("nan")] * 4,                                # all None
+])
+def test_columns_match_scalar_for_edge_values(column):
+    _assert_columns_match([2018, 2019, 2020, 2021], [column])
+
+
+def test_edge_columns_are_independent_of_each_other():
+    nan = float("nan")
+    _assert_columns_match(
+        [2016, 2017, 2019, 2020, 2023],
+        [
+            [nan, nan, nan, nan, nan],
+            [0.0, 3.0, 4.0, 5.0, 9.0],
+            [2.0, nan, -1.0, 8.0, nan],
+            [1.5, 2.5, 3.5, 4.5, 5.5],
+        ],
+    )
+
+
+def test_single_year_has_no_cagr():
+    cagrs = calculate_cagr_columns(np.array([2020]), np.array([[100.0, 5.0]]))
+    assert np.isnan(cagrs).all()
+    assert calculate_cagr([(2020, 100.0)]) is None
+
+
+def test_no_years_gives_one_nan_per_column():
+    cagrs = calculate_cagr_columns(np.array([], dtype=int), np.empty((0, 3)))
+    assert cagrs.shape == (3,)
+    assert np.isnan(cagrs).all()
+
+
+def test_columns_match_scalar_on_random_data():
+    rng = np.random.default_rng(20240101)
+    for _ in range(200):
+        n_years = int(rng.integers(2, 25))
+        years = np.sort(rng.choice(np.arange(1990, 2030), size=n_years, replace=False))
+        values = rng.lognormal(mean=10, sigma=2, size=(n_years, 6))
+        # Sprinkle zeros, negatives and missing values over every column
+        values[rng.random(values.shape) < 0.1] = 0.0
+        values[rng.random(values.shape) < 0.1] *= -1
+        values[rng.random(values.shape) < 0.1] = np.nan
+        _assert_columns_match(years, values.T.tolist())
+
+
+def test_series_matches_scalar():
+    series = pd.Series([None, 0.0, 12.0, 15.0, 21.0], index=[2017, 2018, 2019, 2020, 2021], dtype=float)
+    expected = calculate_cagr([(2017, None), (2018, 0.0), (2019, 12.0), (2020, 15.0), (2021, 21.0)])
+    assert calculate_cagr_series(series) == expected
+
+
+@pytest.mark.parametrize("series", [
+    pd.Series([100.0], index=[2020]),
+    pd.Series([None, None, None], index=[2019, 2020, 2021], dtype=float),
+    pd.Series([10.0, 20.0, None], index=[2019, 2020, 2021], dtype=float),
+    pd.Series([-1.0, 0.0, 3.0], index=[2019, 2020, 2021]),
+])
+def test_series_without_cagr_returns_none(series):
+    assert calculate_cagr_series(series) is None
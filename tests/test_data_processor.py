@@ -0,0 +1,351 @@
+# tests/test_data_processor.py
+
+import os
+import stat
+import threading
+import time
+
+import orjson
+import pytest
+
+from financial_data import data_processor
+from financial_data.clients.fmp_client import FMPError
+from financial_data.data_processor import FinancialDataProcessor
+from financial_data.models import FinancialData
+
+
+@pytest.fixture
+def processor(tmp_path, monkeypatch):
+    # The FMP client opens its response cache in the working directory
+    monkeypatch.chdir(tmp_path)
+    return FinancialDataProcessor(api_key="test", output_dir=str(tmp_path / "output"))
+
+
+class SlowYahoo:
+    """A price download that doesn't finish until the test releases it."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def get_yearly_high_low_range(self, symbol, start_year, end_year):
+        self.release.wait(timeout=10)
+        return {}
+
+
+def _raw_data(**overrides):
+    raw_data = {
+        "profile": {"symbol": "TEST"},
+        "fiscal_year_end": "12-31",
+        "income_statements": [{"date": "2022-12-31"}],
+        "balance_sheets": [{"date": "2022-12-31"}],
+        "cash_flows": [{"date": "2022-12-31"}],
+        "key_metrics": [],
+        "revenue_segmentation": {},
+        "current_stock_price": None,
+    }
+    raw_data.update(overrides)
+    return raw_data
+
+
+def _failing_fetch(symbol):
+    raise FMPError("FMP API request failed: 401")
+
+
+@pytest.mark.parametrize("fetch, start_year, error", [
+    (_failing_fetch, 2020, FMPError),
+    (lambda symbol: _raw_data(cash_flows=[]), 2020, ValueError),
+    (lambda symbol: _raw_data(), 2100, ValueError),
+], ids=["fetch_fails", "statements_missing", "start_after_end"])
+def test_failing_symbol_does_not_wait_for_prices(processor, monkeypatch, fetch, start_year, error):
+    yahoo = SlowYahoo()
+    processor.yahoo_client = yahoo
+    monkeypatch.setattr(processor.data_fetcher, "fetch_all_data", fetch)
+
+    started = time.monotonic()
+    try:
+        with pytest.raises(error):
+            processor.process_company_data("TEST", start_year)
+        assert time.monotonic() - started < 5
+    finally:
+        yahoo.release.set()
+
+
+class FakeProcessPool:
+    """Records how process_many sizes its pool and runs the tasks inline."""
+
+    created = []
+
+    def __init__(self, max_workers, initializer, initargs):
+        FakeProcessPool.created.append((max_workers, initargs[2]))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, *iterables):
+        return [f"{symbol}:{start_year}" for symbol, start_year in zip(*iterables)]
+
+
+@pytest.mark.parametrize("rate_limit, max_workers, expected", [
+    (None, 4, (4, None)),
+    (300, 4, (4, 75)),
+    (10, 4, (4, 2)),
+    # Fewer requests a minute than workers: one request a minute for each of 2 workers
+    (2, 4, (2, 1)),
+])
+def test_process_many_keeps_worker_quotas_within_the_limit(tmp_path, monkeypatch, rate_limit, max_workers, expected):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(data_processor, "ProcessPoolExecutor", FakeProcessPool)
+    FakeProcessPool.created.clear()
+    processor = FinancialDataProcessor(api_key="test", output_dir=str(tmp_path / "output"),
+                                       max_requests_per_minute=rate_limit)
+
+    results = processor.process_many(["ACM", "J"], 2020, max_workers=max_workers, use_processes=True)
+
+    assert results == {"ACM": "ACM:2020", "J": "J:2020"}
+    assert FakeProcessPool.created == [expected]
+    workers, worker_rate_limit = expected
+    if rate_limit:
+        assert workers * worker_rate_limit <= rate_limit
+
+
+def _legacy_yoy_row(year, income, balance, cash_flow, key_metric, balance_by_year, price_ranges):
+    """The per-year loop body _process_yoy_financial_data used before its ratios were vectorized."""
+    total_revenue = income.get("revenue", 0)
+    shares_outstanding = income.get("weightedAverageShsOut", 0)
+    operating_income = income.get("operatingIncome", 0)
+
+    sales_per_share = (total_revenue / shares_outstanding) if shares_outstanding else None
+
+    operating_margin = (operating_income / total_revenue * 100) if total_revenue else None
+    tax_expense = income.get("incomeTaxExpense", 0)
+    income_before_tax = income.get("incomeBeforeTax", 0)
+    tax_rate = (tax_expense / income_before_tax * 100) if income_before_tax else None
+
+    depreciation = income.get("depreciationAndAmortization", 0)
+    net_income = income.get("netIncome", 0)
+    depreciation_pct = (depreciation / net_income * 100) if net_income else None
+
+    book_value = balance.get("totalStockholdersEquity", 0)
+    prev_balance = balance_by_year.get(year - 1)
+    prev_equity = prev_balance.get("totalStockholdersEquity", 0) if prev_balance else 0
+    avg_equity = (book_value + prev_equity) / 2
+
+    roe = (net_income / avg_equity * 100) if avg_equity else None
+
+    total_capital = avg_equity + balance.get("totalDebt", 0)
+    roc = (operating_income / total_capital * 100) if total_capital else None
+
+    book_value_per_share = book_value / shares_outstanding if shares_outstanding else None
+
+    price_high, price_low = price_ranges.get(year, (None, None))
+
+    return FinancialData(
+        net_profit=net_income,
+        diluted_eps=income.get("epsDiluted"),
+        operating_eps=operating_income / shares_outstanding if shares_outstanding else None,
+        pe_ratio=key_metric.get("peRatio", None) if key_metric else None,
+        price_low=price_low,
+        price_high=price_high,
+        dividends_paid=abs(cash_flow.get("dividendsPaid", 0)),
+        dividends_per_share=income.get("dividendPerShare", 0),
+        avg_dividend_yield=key_metric.get("dividendYield", 0) if key_metric else None,
+        shares_outstanding=shares_outstanding,
+        buyback=abs(cash_flow.get("commonStockRepurchased", 0)),
+        share_equity=book_value,
+        book_value_per_share=book_value_per_share,
+        long_term_debt=balance.get("longTermDebt"),
+        roe=roe,
+        roc=roc,
+        revenues=total_revenue,
+        sales_per_share=sales_per_share,
+        operating_margin=operating_margin,
+        tax_rate=tax_rate,
+        depreciation=depreciation,
+        depreciation_pct=depreciation_pct,
+    )
+
+
+def _income(**overrides):
+    income = {
+        "revenue": 1_000_000_000,
+        "weightedAverageShsOut": 150_000_000,
+        "operatingIncome": 210_000_000,
+        "incomeTaxExpense": 40_000_000,
+        "incomeBeforeTax": 190_000_000,
+        "depreciationAndAmortization": 35_000_000,
+        "netIncome": 150_000_000,
+        "epsDiluted": 0.99,
+        "dividendPerShare": 0.25,
+    }
+    income.update(overrides)
+    return income
+
+
+def _balance(**overrides):
+    balance = {"totalStockholdersEquity": 800_000_000, "totalDebt": 300_000_000, "longTermDebt": 250_000_000}
+    balance.update(overrides)
+    return balance
+
+
+def _cash_flow(**overrides):
+    cash_flow = {"dividendsPaid": -37_000_000, "commonStockRepurchased": -12_000_000}
+    cash_flow.update(overrides)
+    return cash_flow
+
+
+INCOME_BY_YEAR = {
+    2018: _income(),
+    2019: _income(revenue=1_130_000_000, operatingIncome=245_000_000, netIncome=171_000_000),
+    # Every ratio denominator is zero
+    2020: _income(revenue=0, weightedAverageShsOut=0, incomeBeforeTax=0, netIncome=0),
+    2021: _income(),
+    2022: _income(operatingIncome=-20_000_000, netIncome=-35_000_000),
+    # Keys missing from the statement fall back to 0
+    2023: {"revenue": 1_400_000_000, "operatingIncome": 260_000_000, "netIncome": 180_000_000},
+}
+BALANCE_BY_YEAR = {
+    2018: _balance(),
+    2019: _balance(totalStockholdersEquity=860_000_000),
+    2020: _balance(),
+    2021: _balance(totalStockholdersEquity=-50_000_000, totalDebt=0),
+    # Averages to zero equity with 2021, and no debt: ROE and ROC have no denominator
+    2022: _balance(totalStockholdersEquity=50_000_000, totalDebt=0),
+    2023: {},
+    2024: _balance(),
+}
+CASH_FLOW_BY_YEAR = {
+    2018: _cash_flow(),
+    2019: _cash_flow(dividendsPaid=0),
+    2020: _cash_flow(),
+    # 2021 has no cash flow statement
+    2022: _cash_flow(),
+    2023: {},
+    2024: _cash_flow(),
+}
+KEY_METRICS_BY_YEAR = {
+    2018: {"peRatio": 18.5, "dividendYield": 0.012},
+    2019: {"peRatio": 21.0},
+    2022: {"dividendYield": 0.02},
+}
+PRICE_RANGES = {2018: (42.0, 30.5), 2019: (51.25, 39.0), 2022: (48.0, 22.0)}
+
+
+def test_yoy_rows_match_legacy_per_year_loop(processor):
+    years = list(range(2017, 2026))
+
+    result = processor._process_yoy_financial_data(
+        "TEST", years, INCOME_BY_YEAR, BALANCE_BY_YEAR, CASH_FLOW_BY_YEAR, KEY_METRICS_BY_YEAR, PRICE_RANGES
+    )
+
+    expected = {
+        year: _legacy_yoy_row(
+            year, INCOME_BY_YEAR[year], BALANCE_BY_YEAR[year], CASH_FLOW_BY_YEAR[year],
+            KEY_METRICS_BY_YEAR.get(year), BALANCE_BY_YEAR, PRICE_RANGES
+        )
+        for year in years
+        if year in INCOME_BY_YEAR and year in BALANCE_BY_YEAR and year in CASH_FLOW_BY_YEAR
+    }
+    # 2017 and 2025 have no statements, 2021 no cash flow and 2024 no income statement
+    assert list(result) == [2018, 2019, 2020, 2022, 2023]
+    assert result == expected
+
+
+def test_zero_denominators_give_none(processor):
+    result = processor._process_yoy_financial_data(
+        "TEST", [2020, 2022], INCOME_BY_YEAR, BALANCE_BY_YEAR, CASH_FLOW_BY_YEAR, KEY_METRICS_BY_YEAR, PRICE_RANGES
+    )
+
+    zero_revenue = result[2020]
+    for field in ("sales_per_share", "operating_eps", "book_value_per_share",
+                  "operating_margin", "tax_rate", "depreciation_pct"):
+        assert getattr(zero_revenue, field) is None, field
+    zero_equity = result[2022]
+    assert zero_equity.roe is None
+    assert zero_equity.roc is None
+
+
+def test_none_fields_give_none_ratios(processor):
+    # FMP sends null for unreported figures; the vectorized ratios treat them as missing
+    income = {2020: _income(revenue=None, weightedAverageShsOut=None, incomeBeforeTax=None, netIncome=None)}
+    balance = {2020: _balance(totalStockholdersEquity=None, totalDebt=None)}
+    cash_flow = {2020: _cash_flow()}
+
+    row = processor._process_yoy_financial_data("TEST", [2020], income, balance, cash_flow, {}, {})[2020]
+
+    for field in ("sales_per_share", "operating_eps", "book_value_per_share", "operating_margin",
+                  "tax_rate", "depreciation_pct", "roe", "roc"):
+        assert getattr(row, field) is None, field
+    assert row.revenues is None
+    assert row.net_profit is None
+    assert row.share_equity is None
+
+
+OUTPUT = {"summary": {"symbol": "TEST"}, "data": {2023: {"revenues": 1.5}, 2024: {"revenues": None}}}
+
+
+def _output_files(processor):
+    return sorted(os.listdir(processor.output_dir))
+
+
+def test_save_json_output_writes_compact_json_by_default(processor):
+    out_file = processor.save_json_output("TEST", OUTPUT)
+
+    with open(out_file, "rb") as f:
+        content = f.read()
+    assert b"\n" not in content
+    assert orjson.loads(content) == {"summary": {"symbol": "TEST"}, "data": {"2023": {"revenues": 1.5}, "2024": {"revenues": None}}}
+    assert _output_files(processor) == ["TEST_yoy_consolidated.json"]
+
+
+def test_save_json_output_pretty_indents(processor):
+    out_file = processor.save_json_output("TEST", OUTPUT, pretty=True)
+
+    with open(out_file, "rb") as f:
+        content = f.read()
+    assert content.startswith(b'{\n  "summary"')
+    assert orjson.loads(content)["data"]["2023"] == {"revenues": 1.5}
+
+
+def test_save_json_output_serialization_error_keeps_previous_file(processor):
+    out_file = processor.save_json_output("TEST", OUTPUT)
+
+    with pytest.raises(TypeError):
+        processor.save_json_output("TEST", {"unserializable": object()})
+
+    with open(out_file, "rb") as f:
+        assert orjson.loads(f.read())["summary"] == {"symbol": "TEST"}
+    assert _output_files(processor) == ["TEST_yoy_consolidated.json"]
+
+
+def test_save_json_output_write_error_removes_tmp_file(processor, monkeypatch):
+    def failing_write(fd, data):
+        raise OSError(28, "No space left on device")
+
+    monkeypatch.setattr(os, "write", failing_write)
+
+    with pytest.raises(OSError):
+        processor.save_json_output("TEST", OUTPUT)
+
+    assert _output_files(processor) == []
+
+
+@pytest.mark.skipif(not hasattr(os, "O_DIRECTORY"), reason="directories can't be fsynced here")
+@pytest.mark.parametrize("durable", [False, True])
+def test_save_json_output_durable_fsyncs_file_and_directory(processor, monkeypatch, durable):
+    synced = []
+    real_fsync = os.fsync
+
+    def recording_fsync(fd):
+        st = os.fstat(fd)
+        synced.append("dir" if stat.S_ISDIR(st.st_mode) else "file")
+        real_fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", recording_fsync)
+
+    processor.save_json_output("TEST", OUTPUT, durable=durable)
+
+    # The file is flushed before the rename and its directory after it
+    assert synced == (["file", "dir"] if durable else [])
@@ -0,0 +1,301 @@
+# tests/test_fmp_client.py
+
+import os
+
+import orjson
+import pytest
+import requests
+
+from financial_data.clients import fmp_client
+from financial_data.clients.fmp_client import QUOTE_TTL, FMPClient, FMPError, get_shared_client
+from financial_data.data_processor import FinancialDataProcessor
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping advances the clock instead of waiting."""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, from_cache=False, status_code=200, payload=({"symbol": "ACM"},)):
+        self.from_cache = from_cache
+        self.status_code = status_code
+        self.content = orjson.dumps(list(payload))
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """
+    Serves URLs in `cached` from the fake on-disk cache, answering only_if_cached
+    misses with a 504 like requests-cache. Requests that reach the network take
+    the next of `outcomes`; an exception there is raised.
+    """
+
+    def __init__(self):
+        self.outcomes = []
+        self.sent_at = []
+        self.cached = set()
+
+    def get(self, url, params, force_refresh=False, only_if_cached=False):
+        if url in self.cached and not force_refresh:
+            return FakeResponse(from_cache=True)
+        if only_if_cached:
+            return FakeResponse(from_cache=True, status_code=504)
+        self.sent_at.append(fmp_client.time.monotonic())
+        outcome = self.outcomes.pop(0) if self.outcomes else FakeResponse()
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(fmp_client, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch, clock):
+    # The response cache is opened in the working directory
+    monkeypatch.chdir(tmp_path)
+    client = FMPClient(api_key="test", max_requests_per_minute=3)
+    client.session = FakeSession()
+    return client
+
+
+def test_requests_within_quota_do_not_wait(client, clock):
+    for _ in range(3):
+        client._get("profile/ACM")
+
+    assert clock.sleeps == []
+    assert client.session.sent_at == [1000.0] * 3
+
+
+def test_full_window_blocks_until_the_oldest_request_ages_out(client, clock):
+    for _ in range(3):
+        client._get("profile/ACM")
+        clock.now += 10
+
+    client._get("profile/ACM")
+
+    # The first request was sent at 1000, so the fourth waits until 1060
+    assert clock.sleeps == [30.0]
+    assert client.session.sent_at == [1000.0, 1010.0, 1020.0, 1060.0]
+
+
+def test_window_slides_rather_than_resetting(client, clock):
+    for _ in range(6):
+        client._get("profile/ACM")
+        clock.now += 15
+
+    # Never more than three requests in any 60 second span
+    sent_at = client.session.sent_at
+    assert all(later - earlier >= 60 for earlier, later in zip(sent_at, sent_at[3:]))
+    assert sent_at == [1000.0, 1015.0, 1030.0, 1060.0, 1075.0, 1090.0]
+
+
+def test_cache_hits_do_not_count_against_the_quota(client, clock):
+    client.session.cached = {f"{client.base_url}/profile/ACM"}
+
+    for _ in range(5):
+        client._get("profile/ACM")
+    for _ in range(3):
+        client._get("income-statement/ACM")
+
+    assert clock.sleeps == []
+    assert len(client._request_times) == 3
+
+
+def test_cache_hits_do_not_wait_for_a_full_window(client, clock):
+    for _ in range(3):
+        client._get("income-statement/ACM")
+    client.session.cached = {f"{client.base_url}/profile/ACM"}
+
+    client._get("profile/ACM")
+
+    assert clock.sleeps == []
+    assert len(client.session.sent_at) == 3
+
+
+def test_force_refresh_skips_the_cache_and_counts(client, clock):
+    client.session.cached = {f"{client.base_url}/profile/ACM"}
+
+    for _ in range(4):
+        client._get("profile/ACM", force_refresh=True)
+
+    assert clock.sleeps == [60.0]
+    assert len(client.session.sent_at) == 4
+
+
+def test_responses_cached_while_waiting_give_back_the_slot(client, clock):
+    # Another thread stored the response between the cache check and the send
+    client.session.outcomes = [FakeResponse(from_cache=True)] * 5
+
+    for _ in range(5):
+        client._get("profile/ACM")
+    for _ in range(3):
+        client._get("profile/ACM")
+
+    assert clock.sleeps == []
+
+
+def test_connection_errors_do_not_count_against_the_quota(client, clock):
+    client.session.outcomes = [requests.exceptions.ConnectionError("refused")] * 2
+
+    for _ in range(2):
+        with pytest.raises(FMPError):
+            client._get("profile/ACM")
+    for _ in range(3):
+        client._get("profile/ACM")
+
+    assert clock.sleeps == []
+    assert len(client._request_times) == 3
+
+
+def test_other_failures_still_count_against_the_quota(client, clock):
+    # A timed-out read may well have reached FMP, so its slot is kept
+    client.session.outcomes = [requests.exceptions.ReadTimeout("slow")]
+
+    with pytest.raises(FMPError):
+        client._get("profile/ACM")
+    for _ in range(3):
+        client._get("profile/ACM")
+
+    assert clock.sleeps == [60.0]
+
+
+def test_no_quota_never_waits(tmp_path, monkeypatch, clock):
+    monkeypatch.chdir(tmp_path)
+    client = FMPClient(api_key="test")
+    client.session = FakeSession()
+
+    for _ in range(100):
+        client._get("profile/ACM")
+
+    assert clock.sleeps == []
+    assert len(client._request_times) == 0
+
+
+def _quote(price):
+    return FakeResponse(payload=[{"symbol": "ACM", "price": price}])
+
+
+def test_quote_is_reused_within_the_ttl(client, clock):
+    client.session.outcomes = [_quote(12.5), _quote(13.0)]
+
+    assert client.get_quote_short("ACM") == 12.5
+    clock.now += QUOTE_TTL - 1
+    assert client.get_quote_short("ACM") == 12.5
+
+    assert len(client.session.sent_at) == 1
+
+
+def test_quote_is_refetched_after_the_ttl(client, clock):
+    client.session.outcomes = [_quote(12.5), _quote(13.0)]
+
+    assert client.get_quote_short("ACM") == 12.5
+    clock.now += QUOTE_TTL
+    assert client.get_quote_short("ACM") == 13.0
+
+    assert len(client.session.sent_at) == 2
+
+
+def test_quote_failures_are_cached_for_the_ttl(client, clock):
+    client.session.outcomes = [requests.exceptions.ConnectionError("refused"), _quote(12.5)]
+
+    assert client.get_quote_short("ACM") is None
+    assert client.get_quote_short("ACM") is None
+    assert len(client.session.sent_at) == 1
+
+    clock.now += QUOTE_TTL
+    assert client.get_quote_short("ACM") == 12.5
+    assert len(client.session.sent_at) == 2
+
+
+def test_quote_force_refresh_skips_the_cache(client, clock):
+    client.session.outcomes = [_quote(12.5), _quote(13.0)]
+
+    assert client.get_quote_short("ACM") == 12.5
+    assert client.get_quote_short("ACM", force_refresh=True) == 13.0
+    # The refreshed price replaces the cached one
+    assert client.get_quote_short("ACM") == 13.0
+
+    assert len(client.session.sent_at) == 2
+
+
+def test_quotes_are_cached_per_symbol(client, clock):
+    client.session.outcomes = [_quote(12.5), _quote(80.0)]
+
+    assert client.get_quote_short("ACM") == 12.5
+    assert client.get_quote_short("J") == 80.0
+    assert client.get_quote_short("ACM") == 12.5
+
+    assert len(client.session.sent_at) == 2
+
+
+@pytest.fixture
+def shared_clients(tmp_path, monkeypatch):
+    """An empty client registry for the test; the real dict is kept so the fork hook still clears it."""
+    monkeypatch.chdir(tmp_path)
+    saved = dict(fmp_client._shared_clients)
+    fmp_client._shared_clients.clear()
+    yield fmp_client._shared_clients
+    fmp_client._shared_clients.clear()
+    fmp_client._shared_clients.update(saved)
+
+
+def test_processors_with_the_same_key_share_a_client(shared_clients, tmp_path):
+    first = FinancialDataProcessor(api_key="key", output_dir=str(tmp_path / "output"))
+    second = FinancialDataProcessor(api_key="key", output_dir=str(tmp_path / "output"))
+
+    assert first.fmp_client is second.fmp_client
+    assert len(shared_clients) == 1
+
+
+def test_different_keys_and_rate_limits_get_separate_clients(shared_clients):
+    client = get_shared_client("key")
+    limited = get_shared_client("key", max_requests_per_minute=300)
+
+    assert limited is not client
+    assert limited is get_shared_client("key", max_requests_per_minute=300)
+    assert get_shared_client("other") is not client
+    # Each client throttles on its own
+    assert client.max_requests_per_minute is None
+    assert limited._request_times is not client._request_times
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_forked_child_starts_with_no_shared_clients(shared_clients):
+    parent_client = get_shared_client("key")
+    read_end, write_end = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        # Child: report whether it was handed the parent's client, then exit without cleanup
+        try:
+            reused = get_shared_client("key") is parent_client
+            os.write(write_end, b"%d%d" % (len(shared_clients), reused))
+        finally:
+            os._exit(0)
+
+    os.close(write_end)
+    with os.fdopen(read_end, "rb") as child_output:
+        report = child_output.read()
+    os.waitpid(pid, 0)
+
+    # The child found an empty registry and built its own client
+    assert report == b"10"
+    assert get_shared_client("key") is parent_client
@@ -0,0 +1,60 @@
+# tests/test_formatters.py
+
+from copy import copy
+
+import pytest
+from openpyxl import Workbook
+from openpyxl.styles import Border, Font, Side
+
+from excel.formatters import THIN_BORDER_SIDE, apply_table_border
+
+
+def _baseline_apply_table_border(ws, row, start_col, end_col):
+    """apply_table_border as it was before unstyled cells got a fast path."""
+    for col in range(start_col, end_col + 1):
+        cell = ws.cell(row=row, column=col)
+        existing_border = cell.border
+        cell.border = Border(
+            top=THIN_BORDER_SIDE,
+            bottom=THIN_BORDER_SIDE,
+            left=existing_border.left or THIN_BORDER_SIDE if col == start_col else existing_border.left,
+            right=existing_border.right or THIN_BORDER_SIDE if col == end_col else existing_border.right,
+            diagonal=existing_border.diagonal,
+            diagonal_direction=existing_border.diagonal_direction,
+            outline=existing_border.outline,
+            vertical=existing_border.vertical,
+            horizontal=existing_border.horizontal,
+        )
+
+
+def _row(apply, start_col, end_col, prepare=None):
+    ws = Workbook().active
+    if prepare:
+        prepare(ws)
+    apply(ws, 2, start_col, end_col)
+    # cell.border is a read-only proxy; copies compare by value
+    return [copy(ws.cell(row=2, column=col).border) for col in range(1, end_col + 2)]
+
+
+def _styled(ws):
+    ws.cell(row=2, column=2).font = Font(bold=True)
+    ws.cell(row=2, column=4).border = Border(left=Side(style="thick"), right=Side(style="dashed"))
+
+
+@pytest.mark.parametrize("start_col, end_col", [(2, 2), (2, 3), (2, 5)])
+@pytest.mark.parametrize("prepare", [None, _styled], ids=["unstyled", "styled"])
+def test_borders_match_baseline(start_col, end_col, prepare):
+    assert _row(apply_table_border, start_col, end_col, prepare) == \
+        _row(_baseline_apply_table_border, start_col, end_col, prepare)
+
+
+
+def test_unstyled_edge_cells_get_no_side_edges():
+    ws = Workbook().active
+    apply_table_border(ws, 1, 1, 3)
+    for col in range(1, 4):
+        border = ws.cell(row=1, column=col).border
+        assert border.top.style == border.bottom.style == "thin"
+        # Side() is truthy, so the baseline kept a default cell's empty left/right sides
+        assert border.left.style is None
+        assert border.right.style is None
@@ -0,0 +1,52 @@
+# tests/test_generator.py
+
+import os
+
+import orjson
+import pytest
+from openpyxl import load_workbook
+
+from excel import generator
+
+FINAL_OUTPUT = {"summary": {"company_name": "Acme", "exchange": "NYSE", "symbol": "ACM", "description": "Builds things."}}
+
+
+@pytest.fixture
+def loads(tmp_path, monkeypatch):
+    """Runs in a scratch directory with ACM's output in place and counts workbook loads."""
+    monkeypatch.chdir(tmp_path)
+    os.makedirs("output")
+    with open(os.path.join("output", "ACM_yoy_consolidated.json"), "wb") as f:
+        f.write(orjson.dumps(FINAL_OUTPUT))
+
+    calls = []
+    real_load_workbook = generator.load_workbook
+
+    def counting_load_workbook(filename):
+        calls.append(filename)
+        return real_load_workbook(filename)
+
+    monkeypatch.setattr(generator, "load_workbook", counting_load_workbook)
+    monkeypatch.setattr(generator, "_workbook_cache", generator.WorkbookCache())
+    return calls
+
+
+def test_second_staged_write_reuses_the_open_workbook(loads):
+    xls_filename = os.path.join("output", "ACM.23.2.xlsx")
+    generator.generate_excel_for_ticker_year("ACM", 2023)
+    assert loads == []
+
+    generator.generate_excel_for_ticker_year("ACM", 2023, defer_save=True)
+    generator.generate_excel_for_ticker_year("ACM", 2023, defer_save=True)
+    generator.flush_workbooks()
+
+    # The existing file is loaded once for the first staged write, then kept open
+    assert loads == [xls_filename]
+    assert "Summary" in load_workbook(xls_filename).sheetnames
+
+
+def test_without_defer_save_every_write_reloads(loads):
+    for _ in range(3):
+        generator.generate_excel_for_ticker_year("ACM", 2023)
+
+    assert len(loads) == 2
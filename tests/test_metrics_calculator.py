@@ -0,0 +1,45 @@
+# tests/test_metrics_calculator.py
+
+import numpy as np
+
+from financial_data.processors.metrics_calculator import MetricsCalculator
+from utils.calculations import calculate_cagr
+
+nan = float("nan")
+
+
+def test_column_cagrs_match_scalar_percent():
+    years = np.array([2019, 2020, 2021, 2022])
+    columns = ["revenues", "earnings", "ebitda"]
+    values = np.array([
+        [100.0, 0.0, 7.0],
+        [120.0, 5.0, 8.0],
+        [130.0, 6.0, 9.0],
+        [150.0, 9.0, 10.0],
+    ])
+
+    cagrs = MetricsCalculator().compute_column_cagrs(years, values, columns)
+
+    assert cagrs == {
+        "cagr_revenues_percent": calculate_cagr(list(zip(years.tolist(), values[:, 0].tolist()))) * 100,
+        "cagr_earnings_percent": calculate_cagr(list(zip(years.tolist(), values[:, 1].tolist()))) * 100,
+        "cagr_ebitda_percent": calculate_cagr(list(zip(years.tolist(), values[:, 2].tolist()))) * 100,
+    }
+
+
+def test_column_cagrs_leave_out_columns_without_a_cagr():
+    years = np.array([2019, 2020, 2021])
+    values = np.array([
+        [nan, -3.0, 10.0, 10.0],
+        [nan, -2.0, 12.0, 11.0],
+        [nan, -1.0, 0.0, nan],
+    ])
+
+    cagrs = MetricsCalculator().compute_column_cagrs(years, values, ["none", "negative", "zero_end", "missing_end"])
+
+    assert cagrs == {}
+
+
+def test_column_cagrs_single_year_is_empty():
+    cagrs = MetricsCalculator().compute_column_cagrs(np.array([2021]), np.array([[100.0, 5.0]]), ["a", "b"])
+    assert cagrs == {}
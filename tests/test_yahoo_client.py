@@ -0,0 +1,119 @@
+# tests/test_yahoo_client.py
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from financial_data.clients import yahoo_client
+from financial_data.clients.yahoo_client import YahooFinanceClient
+
+
+def _prices(start, end):
+    """Daily prices on business days in [start, end), with a spike on every Dec 31."""
+    days = pd.bdate_range(start, end, inclusive="left")
+    high = pd.Series(10.0, index=days)
+    low = pd.Series(5.0, index=days)
+    new_year_eve = (days.month == 12) & (days.day == 31)
+    high[new_year_eve] = 99.0
+    low[new_year_eve] = 1.0
+    return pd.DataFrame({"High": high, "Low": low})
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Replace yf.download with a fake that, like yfinance, treats `end` as exclusive."""
+    calls = []
+
+    def fake_download(symbol, start, end, progress):
+        calls.append((symbol, start, end))
+        return _prices(start, end)
+
+    monkeypatch.setattr(yahoo_client.yf, "download", fake_download)
+    YahooFinanceClient._download_range.cache_clear()
+    yield calls
+    YahooFinanceClient._download_range.cache_clear()
+
+
+def test_range_covers_every_full_year(downloads):
+    ranges = YahooFinanceClient.get_yearly_high_low_range("ACM", 2018, 2020)
+
+    assert downloads == [("ACM", "2018-01-01", "2021-01-01")]
+    # Dec 31 is a business day in all three years; every year, including the last, keeps it
+    assert ranges == {2018: (99.0, 1.0), 2019: (99.0, 1.0), 2020: (99.0, 1.0)}
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A settable monotonic clock, starting at the beginning of a TTL window."""
+    clock = SimpleNamespace(now=1000.0 * yahoo_client.OPEN_RANGE_TTL)
+    monkeypatch.setattr(yahoo_client, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def test_past_ranges_stay_cached(downloads, clock):
+    YahooFinanceClient.get_yearly_high_low_range("ACM", 2018, 2020)
+    clock.now += 10 * yahoo_client.OPEN_RANGE_TTL
+    YahooFinanceClient.get_yearly_high_low_range("ACM", 2018, 2020)
+
+    assert len(downloads) == 1
+
+
+def test_ranges_into_the_current_year_expire(downloads, clock):
+    this_year = datetime.now().year
+
+    YahooFinanceClient.get_yearly_high_low_range("ACM", 2018, this_year)
+    clock.now += yahoo_client.OPEN_RANGE_TTL - 1
+    YahooFinanceClient.get_yearly_high_low_range("ACM", 2018, this_year)
+    assert len(downloads) == 1
+
+    # The current year's high and low are still moving, so they're refetched after the TTL
+    clock.now += 1
+    YahooFinanceClient.get_yearly_high_low_range("ACM", 2018, this_year)
+    assert len(downloads) == 2
+
+
+def test_range_failure_returns_empty_dict(monkeypatch):
+    def failing_download(symbol, start, end, progress):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(yahoo_client.yf, "download", failing_download)
+    YahooFinanceClient._download_range.cache_clear()
+
+    assert YahooFinanceClient.get_yearly_high_low_range("ACM", 2018, 2020) == {}
+
+
+def test_empty_download_is_retried(monkeypatch):
+    # yfinance reports a failed download as an empty frame rather than an exception
+    calls = []
+
+    def flaky_download(symbol, start, end, progress):
+        calls.append((symbol, start, end))
+        return pd.DataFrame() if len(calls) == 1 else _prices(start, end)
+
+    monkeypatch.setattr(yahoo_client.yf, "download", flaky_download)
+    YahooFinanceClient._download_range.cache_clear()
+
+    assert YahooFinanceClient.get_yearly_high_low_range("ACM", 2018, 2020) == {}
+    assert YahooFinanceClient.get_yearly_high_low_range("ACM", 2018, 2020) == {
+        2018: (99.0, 1.0), 2019: (99.0, 1.0), 2020: (99.0, 1.0)
+    }
+    assert len(calls) == 2
+
+
+def test_single_year_lookups_match_the_range(downloads):
+    ranges = YahooFinanceClient.get_yearly_high_low_range("ACM", 2019, 2019)
+
+    assert YahooFinanceClient.get_yearly_high_low("ACM", 2019) == ranges[2019]
+    assert YahooFinanceClient.get_yearly_high("ACM", 2019) == 99.0
+    assert YahooFinanceClient.get_yearly_low("ACM", 2019) == 1.0
+    # High, low and the range all share one cached download
+    assert downloads == [("ACM", "2019-01-01", "2020-01-01")]
+
+
+def test_single_year_without_prices_is_none(monkeypatch):
+    monkeypatch.setattr(yahoo_client.yf, "download", lambda symbol, start, end, progress: pd.DataFrame())
+    YahooFinanceClient._download_range.cache_clear()
+
+    assert YahooFinanceClient.get_yearly_high_low("ACM", 2019) == (None, None)